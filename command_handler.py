@@ -4,279 +4,677 @@ MongoDB Command Handler
 Handles natural language commands and maps them to appropriate MCP tools
 """
 
+import asyncio
+import functools
 import json
 import logging
 import re
-from typing import Any, Dict, List, Optional
+import time
+from collections import deque
+from dataclasses import dataclass
+
+try:  # orjson parses MCP JSON payloads several times faster when installed
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+try:  # re2 compiles the same patterns to linear-time automata when installed
+    import re2 as _re_engine
+except ImportError:
+    _re_engine = re
+
+from itertools import combinations, islice
+from typing import Any, Dict, List, NamedTuple, Optional
 
 logger = logging.getLogger(__name__)
 
+# Single deserialization entry point so every payload parse picks up the
+# faster backend when it is available
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+# Intent patterns, pre-compiled once at import so the per-command hot path
+# skips re's cache lookup and flag parsing. They run with IGNORECASE against
+# the raw command, sparing the per-message lowercased copy.
+_PATTERN_LIST_CLUSTERS = _re_engine.compile(r"(list|show).*cluster", re.IGNORECASE)
+_PATTERN_CREATE_CLUSTER = _re_engine.compile(r"create.*cluster", re.IGNORECASE)
+_PATTERN_ADD_IP_WHITELIST = _re_engine.compile(r"add.*ip.*whitelist", re.IGNORECASE)
+_PATTERN_RESET_PASSWORD = _re_engine.compile(r"reset.*password", re.IGNORECASE)
+_PATTERN_ANALYZE_PERFORMANCE = _re_engine.compile(r"analyz.*performance", re.IGNORECASE)
+_PATTERN_SLOW_QUERIES = _re_engine.compile(r"slow.*quer", re.IGNORECASE)
+_PATTERN_RBAC_REPORT = _re_engine.compile(r"rbac.*report|show.*rbac|rbac.*status", re.IGNORECASE)
+_PATTERN_LIST_ADMINS = _re_engine.compile(r"show.*admin|list.*admin", re.IGNORECASE)
+_PATTERN_CHECK_PERMISSIONS = _re_engine.compile(r"my.*permission|what.*can.*do", re.IGNORECASE)
+_PATTERN_LIST_DATABASES = _re_engine.compile(r"list.*database", re.IGNORECASE)
+_PATTERN_LIST_COLLECTIONS = _re_engine.compile(r"(list|show).*collection", re.IGNORECASE)
+_PATTERN_MISSING_INDEXES = _re_engine.compile(r"missing.*index", re.IGNORECASE)
+_PATTERN_REDUNDANT_INDEXES = _re_engine.compile(r"redundant.*index|duplicate.*index", re.IGNORECASE)
+_PATTERN_SCHEMA_ANALYSIS = _re_engine.compile(r"analyz.*schema|schema.*analysis", re.IGNORECASE)
+
+
+class _KeywordAutomaton:
+    """Minimal Aho-Corasick automaton for multi-keyword substring search.
+
+    Reports which of a fixed set of keywords occur in a string using a
+    single linear pass, instead of one substring/regex scan per keyword.
+    Matching is case-insensitive: both cases of every keyword character are
+    registered as transitions, so the input never needs to be lowercased.
+    """
+
+    def __init__(self, keywords):
+        self._goto = [{}]
+        self._fail = [0]
+        self._output = [set()]
+        for word in keywords:
+            self._add(word)
+        self._link_failures()
+
+    def _add(self, word):
+        state = 0
+        for ch in word:
+            nxt = self._goto[state].get(ch)
+            if nxt is None:
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append(set())
+                nxt = len(self._goto) - 1
+                self._goto[state][ch] = nxt
+                upper = ch.upper()
+                if upper != ch:
+                    self._goto[state][upper] = nxt
+            state = nxt
+        self._output[state].add(word)
+
+    def _link_failures(self):
+        # Both cases of a character share one target state, so dedupe while
+        # walking or every state past the root would be queued twice per level
+        seen = set(self._goto[0].values())
+        queue = deque(seen)
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self._goto[state].items():
+                if nxt in seen:
+                    continue
+                seen.add(nxt)
+                queue.append(nxt)
+                fail = self._fail[state]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                candidate = self._goto[fail].get(ch, 0)
+                self._fail[nxt] = candidate if candidate != nxt else 0
+                self._output[nxt] |= self._output[self._fail[nxt]]
+
+    def search(self, text):
+        """Return the set of keywords appearing as substrings of text"""
+        goto, fail, output = self._goto, self._fail, self._output
+        state = 0
+        hits = set()
+        for ch in text:
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if output[state]:
+                hits |= output[state]
+        return hits
+
+
+@dataclass(frozen=True, slots=True)
+class CommandInfo:
+    """Categorized command with its extracted parameters.
+
+    Frozen with __slots__ so one instance can be cached and shared across
+    callers, and downstream reads are fixed-offset attribute lookups
+    instead of per-access dict hashing.
+    """
+
+    category: str
+    action: str
+    tools: tuple = ()
+    cluster_name: Optional[str] = None
+    ip_address: Optional[str] = None
+    time_range: Optional[Dict[str, Any]] = None
+    database: Optional[str] = None
+    collection: Optional[str] = None
+
+
+class _Intent(NamedTuple):
+    """One entry of the intent dispatch table"""
+
+    pattern: "re.Pattern[str]"
+    category: str
+    action: str
+    tools: tuple
+    params: tuple
+    keywords: frozenset  # keywords that must all be present for a match
+    any_of: frozenset = frozenset()  # at least one must be present, if non-empty
+
+
+# Intent dispatch table. Entries are tried in precedence order and the first
+# pattern that matches wins. The order is the reverse of the old sequential
+# if-chain, where later blocks overwrote earlier matches; a single regex
+# alternation cannot reproduce that precedence (re.search is leftmost-match,
+# not pattern-priority), so one compiled pattern per intent is kept and
+# scanning stops at the first hit. Each entry's keyword sets act as a cheap
+# prefilter: the regex only runs when the automaton saw its keywords, so a
+# typical command pays one linear keyword scan plus a single regex search.
+_INTENT_TABLE = (
+    _Intent(
+        _PATTERN_SCHEMA_ANALYSIS,
+        "database",
+        "schema_analysis",
+        ("connect", "collection-schema"),
+        ("collection",),
+        frozenset({"schema"}),
+        frozenset({"analyz", "analysis"}),
+    ),
+    _Intent(
+        _PATTERN_REDUNDANT_INDEXES,
+        "optimization",
+        "redundant_indexes",
+        ("connect", "list-collections", "collection-indexes"),
+        ("database",),
+        frozenset({"index"}),
+        frozenset({"redundant", "duplicate"}),
+    ),
+    _Intent(
+        _PATTERN_MISSING_INDEXES,
+        "optimization",
+        "missing_indexes",
+        ("connect", "list-collections", "collection-indexes", "collection-schema"),
+        ("database",),
+        frozenset({"missing", "index"}),
+    ),
+    _Intent(
+        _PATTERN_LIST_COLLECTIONS,
+        "database",
+        "list_collections",
+        ("connect", "list-collections"),
+        ("database",),
+        frozenset({"collection"}),
+        frozenset({"list", "show"}),
+    ),
+    _Intent(
+        _PATTERN_LIST_DATABASES,
+        "database",
+        "list_databases",
+        ("connect", "list-databases"),
+        (),
+        frozenset({"list", "database"}),
+    ),
+    _Intent(
+        _PATTERN_CHECK_PERMISSIONS,
+        "rbac",
+        "check_permissions",
+        (),
+        (),
+        frozenset(),
+        frozenset({"permission", "do"}),
+    ),
+    _Intent(
+        _PATTERN_LIST_ADMINS,
+        "rbac",
+        "list_admins",
+        (),
+        (),
+        frozenset({"admin"}),
+        frozenset({"show", "list"}),
+    ),
+    _Intent(_PATTERN_RBAC_REPORT, "rbac", "rbac_report", (), (), frozenset({"rbac"})),
+    _Intent(
+        _PATTERN_SLOW_QUERIES,
+        "performance",
+        "slow_queries",
+        ("connect", "aggregate"),
+        ("cluster_name",),
+        frozenset({"slow", "quer"}),
+    ),
+    _Intent(
+        _PATTERN_ANALYZE_PERFORMANCE,
+        "performance",
+        "analyze_performance",
+        ("atlas-list-clusters", "atlas-inspect-cluster"),
+        ("cluster_name", "time_range"),
+        frozenset({"analyz", "performance"}),
+    ),
+    _Intent(
+        _PATTERN_RESET_PASSWORD,
+        "security",
+        "reset_password",
+        ("atlas-list-db-users", "atlas-create-db-user"),
+        (),
+        frozenset({"reset", "password"}),
+    ),
+    _Intent(
+        _PATTERN_ADD_IP_WHITELIST,
+        "security",
+        "add_ip_whitelist",
+        ("atlas-inspect-access-list", "atlas-create-access-list"),
+        ("ip_address",),
+        frozenset({"add", "ip", "whitelist"}),
+    ),
+    _Intent(
+        _PATTERN_CREATE_CLUSTER,
+        "atlas_management",
+        "create_cluster",
+        ("atlas-create-free-cluster",),
+        ("cluster_name",),
+        frozenset({"create", "cluster"}),
+    ),
+    _Intent(
+        _PATTERN_LIST_CLUSTERS,
+        "atlas_management",
+        "list_clusters",
+        ("atlas-list-clusters",),
+        (),
+        frozenset({"cluster"}),
+        frozenset({"list", "show"}),
+    ),
+)
+
+# Automaton over every keyword referenced by the dispatch table
+_INTENT_KEYWORDS = _KeywordAutomaton(
+    sorted(frozenset().union(*(e.keywords | e.any_of for e in _INTENT_TABLE)))
+)
+
+_INTENT_BY_ACTION = {intent.action: intent for intent in _INTENT_TABLE}
+
+# Bare commands with no parameters of their own, resolved by one dict
+# lookup on the normalized string before any other matching. "help" has no
+# dispatch-table entry (it is the fallback intent), so it gets a synthetic
+# one here; its pattern is a never-matching sentinel, since the exact-match
+# path never consults it.
+_EXACT_COMMANDS = {
+    "help": _Intent(re.compile(r"(?!)"), "general", "help", (), (), frozenset()),
+    "what can i do": _INTENT_BY_ACTION["check_permissions"],
+    "list admins": _INTENT_BY_ACTION["list_admins"],
+    "show rbac report": _INTENT_BY_ACTION["rbac_report"],
+}
+
+# Whole-word token sets that identify an intent on their own. Checked with a
+# C-level frozenset subset test before the automaton+regex pass, so common
+# phrasings resolve without a single regex search. Only phrases whose words
+# are unambiguous regardless of ordering are listed; anything else falls
+# through to the ordered dispatch table.
+_TOKEN_INTENTS = tuple(
+    (frozenset(phrase.split()), _INTENT_BY_ACTION[action])
+    for phrase, action in (
+        ("missing indexes", "missing_indexes"),
+        ("redundant indexes", "redundant_indexes"),
+        ("duplicate indexes", "redundant_indexes"),
+        ("slow queries", "slow_queries"),
+        ("reset password", "reset_password"),
+        ("rbac report", "rbac_report"),
+        ("list admins", "list_admins"),
+        ("what can i do", "check_permissions"),
+    )
+)
+
+# Maps dispatch-table param names to the extractor method that fills them
+_PARAM_EXTRACTORS = {
+    "cluster_name": "_extract_cluster_name",
+    "ip_address": "_extract_ip_address",
+    "time_range": "_extract_time_range",
+    "database": "_extract_database_name",
+    "collection": "_extract_collection_name",
+}
+
+# Parameters extracted for every command regardless of the matched intent,
+# set only when a value is actually found
+_COMMON_PARAMS = ("cluster_name", "ip_address")
+
+# Parameter extraction patterns run against the original command text. All
+# quantifiers are bounded (names to 64 chars, free-text gaps to 128) so the
+# engine's backtracking stays linear even on adversarial Slack input. The
+# patterns stay as an ordered tuple rather than one alternation because the
+# stopword fallback in _extract_cluster_name depends on trying them in
+# priority order, which leftmost-match alternation cannot reproduce.
+_CLUSTER_NAME_PATTERNS = tuple(
+    _re_engine.compile(p, re.IGNORECASE)
+    for p in [
+        r"cluster[:\s]+([a-zA-Z0-9_-]{1,64})",
+        r"on\s+cluster\s+([a-zA-Z0-9_-]{1,64})",
+        r"called\s+([a-zA-Z0-9_-]{1,64})",
+        r"named\s+([a-zA-Z0-9_-]{1,64})",
+        r"for\s+cluster\s+([a-zA-Z0-9_-]{1,64})",
+        r"details\s+for\s+cluster\s+([a-zA-Z0-9_-]{1,64})",
+        r"issues\s+on\s+([a-zA-Z0-9_-]{1,64})",
+        r"performance\s+.{0,128}\s+([a-zA-Z0-9_-]{1,64})",
+        r"cluster\s+([a-zA-Z0-9_-]{1,64})",  # Simple "cluster name" pattern
+        r"([a-zA-Z0-9_-]{1,64})\s+cluster",  # "name cluster" pattern
+        r"cluster\s+called\s+([a-zA-Z0-9_-]{1,64})",  # "cluster called name" pattern
+        r"([a-zA-Z0-9_-]{1,64})(?:\s+cluster|\s*$)",  # "name cluster" or "name" at end
+    ]
+)
+_CLUSTER_FALLBACK = _re_engine.compile(r"cluster\s+([a-zA-Z0-9_-]{1,64})", re.IGNORECASE)
+_CLUSTER_FALLBACK_ON = _re_engine.compile(r"on\s+([a-zA-Z0-9_-]{1,64})\s*$", re.IGNORECASE)
+_CLUSTER_FALLBACK_FOR = _re_engine.compile(r"for\s+([a-zA-Z0-9_-]{1,64})\s*$", re.IGNORECASE)
+
+# Words that look like names to the cluster patterns but never are
+_CLUSTER_STOPWORDS = frozenset({"called", "named", "for", "on", "in", "the", "a", "an"})
+
+# Keywords that anchor an IP address in a command, in preference order. The
+# scanner prefers the first IP found after one of these before falling back
+# to the first valid IPv4 substring anywhere.
+_IP_KEYWORD_PATTERNS = tuple(
+    _re_engine.compile(re.escape(keyword), re.IGNORECASE)
+    for keyword in ("ip", "whitelist", "access from")
+)
+
+
+def _scan_ipv4(text: str, start: int = 0) -> Optional[str]:
+    """Return the first valid dotted-quad IPv4 substring at or after ``start``.
+
+    A single linear character scan with no backtracking: octets are
+    accumulated digit by digit and rejected as soon as they exceed 255 or
+    three digits, making the parse immune to pathological inputs. Digits
+    are recognized by ASCII range comparison rather than str.isdigit,
+    which also accepts non-ASCII unicode digits that would corrupt the
+    ord-based octet arithmetic.
+    """
+    n = len(text)
+    i = start
+    while i < n:
+        if not "0" <= text[i] <= "9":
+            i += 1
+            continue
+        j = i
+        octets = 0
+        value = 0
+        digits = 0
+        valid = True
+        while j < n:
+            ch = text[j]
+            if "0" <= ch <= "9":
+                value = value * 10 + (ord(ch) - 48)
+                digits += 1
+                if digits > 3 or value > 255:
+                    valid = False
+                    break
+                j += 1
+            elif ch == "." and digits and octets < 3:
+                octets += 1
+                value = 0
+                digits = 0
+                j += 1
+            else:
+                break
+        if valid and octets == 3 and digits:
+            return text[i:j]
+        # Skip past this run of IP-like characters before rescanning
+        i = j
+        while i < n and ("0" <= text[i] <= "9" or text[i] == "."):
+            i += 1
+        i += 1
+    return None
+
+
+# Time-range unit tokens mapped to the keyword each one fills. Singular and
+# plural forms are listed so no per-token normalization is needed.
+_TIME_UNITS = {
+    "hour": "hours",
+    "hours": "hours",
+    "day": "days",
+    "days": "days",
+    "week": "weeks",
+    "weeks": "weeks",
+}
+
+# The bare "in <word>" pattern appears in both tuples; compile it once and
+# share the Pattern object
+_IN_PATTERN = _re_engine.compile(r"in\s+(\w+)", re.IGNORECASE)
+
+_DB_PATTERNS = (
+    _re_engine.compile(r"database[:\s]+(\w+)", re.IGNORECASE),
+    _IN_PATTERN,
+    _re_engine.compile(r"from\s+(\w+)", re.IGNORECASE),
+)
+
+_COLLECTION_PATTERNS = (
+    _re_engine.compile(r"collection[:\s]+(\w+)", re.IGNORECASE),
+    _re_engine.compile(r"for\s+(\w+)", re.IGNORECASE),
+    _IN_PATTERN,
+)
+
+
+# Static help text, built once at import instead of on every help request
+_HELP_TEXT = """
+🤖 **MongoDB Atlas Assistant Help**
+
+**Atlas Management:**
+• List my clusters
+• Create a new cluster called [name]
+• Show cluster details for [cluster]
+
+**Performance Analysis:**
+• Analyze cluster [name] performance over last [time]
+• Show slow queries on cluster [name]
+• Performance summary for [cluster]
+
+**Database Operations:**
+• List all databases
+• Show collections in database [name]
+• Analyze schema for collection [name]
+
+**Security:**
+• Add IP [address] to whitelist
+• Reset password for user [name]
+
+**Optimization:**
+• Find missing indexes in database [name]
+• Find redundant indexes in database [name]
+• Show duplicate indexes
+• Storage usage analysis
+
+Use natural language - I'll understand your intent!
+        """
+
 
 class MongoCommandHandler:
     """Handles MongoDB command processing and MCP tool orchestration"""
 
     def __init__(self, mcp_session):
         self.mcp_session = mcp_session
-        self.available_tools = []
+        self.available_tools = frozenset()
+        self.tools_csv = ""  # pre-joined tool names for prompt assembly
         self.tool_cache = {}
+        self._tools_fetched_at = 0.0  # monotonic timestamp of the last refresh
+        # Category-to-handler dispatch, one dict lookup instead of an
+        # if/elif chain walked on every command
+        self._handlers = {
+            "atlas_management": self._handle_atlas_management,
+            "performance": self._handle_performance_analysis,
+            "database": self._handle_database_operations,
+            "optimization": self._handle_optimization,
+            "security": self._handle_security,
+            "rbac": self._handle_rbac_commands,
+        }
 
     async def refresh_tools(self):
         """Refresh available MCP tools"""
         try:
             tools_response = await self.mcp_session.list_tools()
-            self.available_tools = [tool.name for tool in tools_response.tools]
-            logger.info(f"Available tools: {self.available_tools}")
+            self.tool_cache = {tool.name: tool for tool in tools_response.tools}
+            self.available_tools = frozenset(self.tool_cache)
+            self.tools_csv = ", ".join(sorted(self.available_tools))
+            self._tools_fetched_at = time.monotonic()
+            logger.info(f"Available tools: {sorted(self.available_tools)}")
         except Exception as e:
             logger.error(f"Error refreshing tools: {e}")
 
-    def categorize_command(self, command: str) -> Dict[str, Any]:
+    async def ensure_tools(self, ttl: float = 60.0):
+        """Refresh the tool list only if the cached copy is older than ttl.
+
+        Bursts of commands can otherwise trigger redundant list_tools
+        round-trips for a list that rarely changes.
+        """
+        if time.monotonic() - self._tools_fetched_at >= ttl:
+            await self.refresh_tools()
+
+    def categorize_command(self, command: str) -> CommandInfo:
         """Categorize the command and extract key parameters"""
-        command_lower = command.lower()
+        # Slack traffic repeats the same short commands constantly, and
+        # categorization is deterministic in its input, so memoize by the raw
+        # command string. CommandInfo is frozen, so the cached instance is
+        # handed out directly with no defensive copy.
+        return self._categorize_cached(command)
+
+    @functools.lru_cache(maxsize=1024)
+    def _categorize_cached(self, command: str) -> CommandInfo:
+        """Uncached categorization; see categorize_command"""
         result: Dict[str, Any] = {}
 
-        # Atlas Management Commands
-        if re.search(r"(list|show).*cluster", command_lower):
-            result["category"] = "atlas_management"
-            result["action"] = "list_clusters"
-            result["tools"] = ["atlas-list-clusters"]
-
-        if re.search(r"create.*cluster", command_lower):
-            result["category"] = "atlas_management"
-            result["action"] = "create_cluster"
-            result["tools"] = ["atlas-create-free-cluster"]
-            result["cluster_name"] = self._extract_cluster_name(command)
-
-        if re.search(r"add.*ip.*whitelist", command_lower):
-            result["category"] = "security"
-            result["action"] = "add_ip_whitelist"
-            result["tools"] = ["atlas-inspect-access-list", "atlas-create-access-list"]
-            result["ip_address"] = self._extract_ip_address(command)
-
-        if re.search(r"reset.*password", command_lower):
-            result["category"] = "security"
-            result["action"] = "reset_password"
-            result["tools"] = ["atlas-list-db-users", "atlas-create-db-user"]
-
-        # Performance Analysis Commands
-        if re.search(r"analyz.*performance", command_lower):
-            result["category"] = "performance"
-            result["action"] = "analyze_performance"
-            result["tools"] = ["atlas-list-clusters", "atlas-inspect-cluster"]
-            result["cluster_name"] = self._extract_cluster_name(command)
-            result["time_range"] = self._extract_time_range(command)
-
-        if re.search(r"slow.*quer", command_lower):
-            result["category"] = "performance"
-            result["action"] = "slow_queries"
-            result["tools"] = ["connect", "aggregate"]
-            result["cluster_name"] = self._extract_cluster_name(command)
-
-        if re.search(r"show.*collection", command_lower):
-            result["category"] = "database"
-            result["action"] = "list_collections"
-            result["tools"] = ["connect", "list-collections"]
-            result["database"] = self._extract_database_name(command)
-
-        if re.search(r"analyz.*schema", command_lower):
-            result["category"] = "database"
-            result["action"] = "schema_analysis"
-            result["tools"] = ["connect", "collection-schema"]
-            result["collection"] = self._extract_collection_name(command)
-
-        # RBAC Commands
-        if re.search(r"rbac.*report|show.*rbac|rbac.*status", command_lower):
-            result["category"] = "rbac"
-            result["action"] = "rbac_report"
-            result["tools"] = []
-
-        if re.search(r"show.*admin|list.*admin", command_lower):
-            result["category"] = "rbac"
-            result["action"] = "list_admins"
-            result["tools"] = []
-
-        if re.search(r"my.*permission|what.*can.*do", command_lower):
-            result["category"] = "rbac"
-            result["action"] = "check_permissions"
-            result["tools"] = []
-
-        # Database Operations
-        if re.search(r"list.*database", command_lower):
-            result["category"] = "database"
-            result["action"] = "list_databases"
-            result["tools"] = ["connect", "list-databases"]
-
-        if re.search(r"list.*collection", command_lower):
-            result["category"] = "database"
-            result["action"] = "list_collections"
-            result["tools"] = ["connect", "list-collections"]
-            result["database"] = self._extract_database_name(command)
-
-        if re.search(r"missing.*index", command_lower):
-            result["category"] = "optimization"
-            result["action"] = "missing_indexes"
-            result["tools"] = [
-                "connect",
-                "list-collections",
-                "collection-indexes",
-                "collection-schema",
-            ]
-            result["database"] = self._extract_database_name(command)
-
-        if re.search(r"redundant.*index|duplicate.*index", command_lower):
-            result["category"] = "optimization"
-            result["action"] = "redundant_indexes"
-            result["tools"] = ["connect", "list-collections", "collection-indexes"]
-            result["database"] = self._extract_database_name(command)
-
-        if re.search(r"schema.*analysis", command_lower):
-            result["category"] = "database"
-            result["action"] = "schema_analysis"
-            result["tools"] = ["connect", "collection-schema"]
-            result["collection"] = self._extract_collection_name(command)
-
-        # Extract IP address from any command if not already extracted
-        if "ip_address" not in result:
-            ip_match = re.search(r"(?:\b|\D)((?:\d{1,3}\.){3}\d{1,3})(?:\b|\D)", command)
-            if ip_match:
-                result["ip_address"] = ip_match.group(1)
-
-        # Extract cluster name for any command if not already set
-        if "cluster_name" not in result:
-            cluster_name = self._extract_cluster_name(command)
-            if cluster_name:
-                result["cluster_name"] = cluster_name
+        # Exact-string lookup for bare commands, then the token-set fast
+        # path for unambiguous phrases, then the ordered automaton+regex
+        # dispatch for everything else
+        matched = _EXACT_COMMANDS.get(command.lower().strip())
+        if matched is None:
+            tokens = frozenset(command.lower().split())
+            for token_set, intent in _TOKEN_INTENTS:
+                if token_set <= tokens:
+                    matched = intent
+                    break
+
+        if matched is None:
+            hits = _INTENT_KEYWORDS.search(command)
+            for intent in _INTENT_TABLE:
+                if not intent.keywords <= hits:
+                    continue
+                if intent.any_of and not (intent.any_of & hits):
+                    continue
+                if intent.pattern.search(command):
+                    matched = intent
+                    break
+
+        if matched is not None:
+            result["category"] = matched.category
+            result["action"] = matched.action
+            result["tools"] = matched.tools
+            for param in matched.params:
+                result[param] = getattr(self, _PARAM_EXTRACTORS[param])(command)
+
+        # Common parameters run for every command through the same extractor
+        # mapping as the table-driven ones, replacing the old post-hoc blocks
+        for param in _COMMON_PARAMS:
+            if param not in result:
+                value = getattr(self, _PARAM_EXTRACTORS[param])(command)
+                if value:
+                    result[param] = value
 
         # Default fallback only if no category was set
         if "category" not in result:
             result["category"] = "general"
             result["action"] = "help"
-            result["tools"] = []
 
-        return result
+        return CommandInfo(**result)
 
     def _extract_cluster_name(self, command: str) -> Optional[str]:
         """Extract cluster name from command"""
-        patterns = [
-            r"cluster[:\s]+([a-zA-Z0-9_-]+)",
-            r"on\s+cluster\s+([a-zA-Z0-9_-]+)",
-            r"called\s+([a-zA-Z0-9_-]+)",
-            r"named\s+([a-zA-Z0-9_-]+)",
-            r"for\s+cluster\s+([a-zA-Z0-9_-]+)",
-            r"details\s+for\s+cluster\s+([a-zA-Z0-9_-]+)",
-            r"issues\s+on\s+([a-zA-Z0-9_-]+)",
-            r"performance\s+.*\s+([a-zA-Z0-9_-]+)",
-            r"cluster\s+([a-zA-Z0-9_-]+)",  # Simple "cluster name" pattern
-            r"([a-zA-Z0-9_-]+)\s+cluster",  # "name cluster" pattern
-            r"cluster\s+called\s+([a-zA-Z0-9_-]+)",  # "cluster called name" pattern
-            r"([a-zA-Z0-9_-]+)(?:\s+cluster|\s*$)",  # "name cluster" or "name" at end
-        ]
-        stopwords = ["called", "named", "for", "on", "in", "the", "a", "an"]
-        for pattern in patterns:
-            match = re.search(pattern, command, re.IGNORECASE)
+
+        def _accept(name: Optional[str]) -> Optional[str]:
+            if name and name.lower() not in _CLUSTER_STOPWORDS:
+                return name
+            return None
+
+        for pattern in _CLUSTER_NAME_PATTERNS:
+            match = pattern.search(command)
             if match:
-                cluster_name = match.group(1)
-                if cluster_name.lower() not in stopwords:
+                cluster_name = _accept(match.group(1))
+                if cluster_name:
                     return cluster_name
         # Fallback: if 'cluster' is followed by a word, use that word
-        fallback = re.search(r"cluster\s+([a-zA-Z0-9_-]+)", command, re.IGNORECASE)
+        fallback = _CLUSTER_FALLBACK.search(command)
         if fallback:
-            cluster_name = fallback.group(1)
-            if cluster_name.lower() not in stopwords:
+            cluster_name = _accept(fallback.group(1))
+            if cluster_name:
                 return cluster_name
         # Fallback: if command ends with 'on [word]' or 'for [word]', use that word
-        fallback_on = re.search(r"on\s+([a-zA-Z0-9_-]+)\s*$", command, re.IGNORECASE)
-        if fallback_on:
-            cluster_name = fallback_on.group(1)
-            if cluster_name.lower() not in stopwords:
-                return cluster_name
-        fallback_for = re.search(r"for\s+([a-zA-Z0-9_-]+)\s*$", command, re.IGNORECASE)
-        if fallback_for:
-            cluster_name = fallback_for.group(1)
-            if cluster_name.lower() not in stopwords:
-                return cluster_name
+        for pattern in (_CLUSTER_FALLBACK_ON, _CLUSTER_FALLBACK_FOR):
+            match = pattern.search(command)
+            if match:
+                cluster_name = _accept(match.group(1))
+                if cluster_name:
+                    return cluster_name
         # Final fallback: use the last word if not a stopword
         words = command.strip().split()
         if words:
-            last_word = words[-1].strip(".,!?")
-            if last_word.lower() not in stopwords:
-                return last_word
+            return _accept(words[-1].strip(".,!?"))
         return None
 
     def _extract_ip_address(self, command: str) -> Optional[str]:
         """Extract IP address from command"""
-        # Look for IP patterns with various keywords
-        patterns = [
-            r"IP\s+(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})",
-            r"whitelist\s+(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})",
-            r"access\s+from\s+(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})",
-            r"(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})",
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, command, re.IGNORECASE)
+        # Prefer an IP anchored by a keyword, then fall back to anywhere
+        for pattern in _IP_KEYWORD_PATTERNS:
+            match = pattern.search(command)
             if match:
-                return match.group(1)
-        return None
+                ip_address = _scan_ipv4(command, match.end())
+                if ip_address:
+                    return ip_address
+        return _scan_ipv4(command)
 
     def _extract_time_range(self, command: str) -> Dict[str, Any]:
         """Extract time range from command"""
-        time_patterns = {
-            r"last\s+(\d+)\s+hour": lambda x: {"hours": int(x)},
-            r"last\s+(\d+)\s+day": lambda x: {"days": int(x)},
-            r"last\s+(\d+)\s+week": lambda x: {"weeks": int(x)},
-            r"(\d+)\s+hour": lambda x: {"hours": int(x)},
-            r"(\d+)\s+day": lambda x: {"days": int(x)},
-        }
-
-        for pattern, parser in time_patterns.items():
-            match = re.search(pattern, command, re.IGNORECASE)
-            if match:
-                return parser(match.group(1))
+        # A single pass over the tokens replaces the old five-regex cascade:
+        # any number immediately followed by a unit word wins
+        tokens = command.lower().split()
+        for pos, token in enumerate(tokens[:-1]):
+            if token.isdigit():
+                unit = _TIME_UNITS.get(tokens[pos + 1].strip(".,!?"))
+                if unit:
+                    return {unit: int(token)}
 
         return {"hours": 24}  # Default to 24 hours
 
     def _extract_database_name(self, command: str) -> Optional[str]:
         """Extract database name from command"""
-        patterns = [r"database[:\s]+(\w+)", r"in\s+(\w+)", r"from\s+(\w+)"]
-
-        for pattern in patterns:
-            match = re.search(pattern, command, re.IGNORECASE)
+        for pattern in _DB_PATTERNS:
+            match = pattern.search(command)
             if match:
                 return match.group(1)
         return None
 
     def _extract_collection_name(self, command: str) -> Optional[str]:
         """Extract collection name from command"""
-        patterns = [r"collection[:\s]+(\w+)", r"for\s+(\w+)", r"in\s+(\w+)"]
-
-        for pattern in patterns:
-            match = re.search(pattern, command, re.IGNORECASE)
+        for pattern in _COLLECTION_PATTERNS:
+            match = pattern.search(command)
             if match:
                 return match.group(1)
         return None
 
-    async def execute_command(self, command_info: Dict[str, Any]) -> Dict[str, Any]:
-        """Execute MCP tools based on command analysis"""
+    async def execute_command(
+        self, command_info: CommandInfo, session: Optional[Any] = None
+    ) -> Dict[str, Any]:
+        """Execute MCP tools based on command analysis.
+
+        A session may be passed explicitly; otherwise the handler's own is
+        used. When that session is a pool, one member is pinned for the
+        whole command so stateful tools like connect apply to the same
+        session as the queries that follow them.
+        """
         results: Dict[str, Any] = {}
 
         try:
-            category = command_info["category"]
-            action = command_info["action"]
-
-            if category == "atlas_management":
-                results = await self._handle_atlas_management(action, command_info)
-            elif category == "performance":
-                results = await self._handle_performance_analysis(action, command_info)
-            elif category == "database":
-                results = await self._handle_database_operations(action, command_info)
-            elif category == "optimization":
-                results = await self._handle_optimization(action, command_info)
-            elif category == "security":
-                results = await self._handle_security(action, command_info)
-            elif category == "rbac":
-                results = await self._handle_rbac_commands(action, command_info)
+            category = command_info.category
+            action = command_info.action
+
+            handler = self._handlers.get(category)
+            if handler is None:
+                return {"help": _HELP_TEXT}
+
+            if session is None:
+                session = self.mcp_session
+
+            # Re-validate the cached tool list before dispatch; inside the
+            # TTL this costs one clock read, so the command path stays cheap
+            # while a server restart that changed the tool set is picked up
+            # within a minute
+            if self.mcp_session is not None:
+                await self.ensure_tools()
+
+            checkout = getattr(session, "checkout", None)
+            if checkout is not None:
+                async with checkout() as pinned:
+                    results = await handler(action, command_info, pinned)
             else:
-                results = {"help": self._get_help_text()}
+                results = await handler(action, command_info, session)
 
         except Exception as e:
             logger.error(f"Error executing command: {e}")
@@ -285,49 +683,49 @@ class MongoCommandHandler:
         return results
 
     async def _handle_atlas_management(
-        self, action: str, command_info: Dict[str, Any]
+        self, action: str, command_info: CommandInfo, session: Any
     ) -> Dict[str, Any]:
         """Handle Atlas management commands"""
         results: Dict[str, Any] = {}
 
         if action == "list_clusters":
-            clusters = await self.mcp_session.call_tool("atlas-list-clusters", {})
+            clusters = await session.call_tool("atlas-list-clusters", {})
             results["clusters"] = clusters
 
         elif action == "create_cluster":
-            cluster_name = command_info.get("cluster_name", "new-cluster")
+            cluster_name = command_info.cluster_name or "new-cluster"
             cluster_params = {
                 "name": cluster_name,
                 "provider": "AWS",
                 "region": "US_EAST_1",
                 "instanceSize": "M0",
             }
-            cluster = await self.mcp_session.call_tool("atlas-create-free-cluster", cluster_params)
+            cluster = await session.call_tool("atlas-create-free-cluster", cluster_params)
             results["cluster_creation"] = cluster
 
         return results
 
     async def _handle_performance_analysis(
-        self, action: str, command_info: Dict[str, Any]
+        self, action: str, command_info: CommandInfo, session: Any
     ) -> Dict[str, Any]:
         """Handle performance analysis commands"""
         results: Dict[str, Any] = {}
 
         if action == "analyze_performance":
             # First get clusters
-            clusters = await self.mcp_session.call_tool("atlas-list-clusters", {})
+            clusters = await session.call_tool("atlas-list-clusters", {})
             results["clusters"] = clusters
 
             # If specific cluster mentioned, get detailed info
-            if command_info.get("cluster_name"):
-                cluster_details = await self.mcp_session.call_tool(
-                    "atlas-inspect-cluster", {"clusterName": command_info["cluster_name"]}
+            if command_info.cluster_name:
+                cluster_details = await session.call_tool(
+                    "atlas-inspect-cluster", {"clusterName": command_info.cluster_name}
                 )
                 results["cluster_details"] = cluster_details
 
         elif action == "slow_queries":
             # Connect to database and analyze slow queries
-            if command_info.get("cluster_name"):
+            if command_info.cluster_name:
                 # This would require connecting to the specific cluster
                 # and running performance analysis queries
                 results["slow_queries"] = {
@@ -337,14 +735,14 @@ class MongoCommandHandler:
         return results
 
     async def _handle_database_operations(
-        self, action: str, command_info: Dict[str, Any]
+        self, action: str, command_info: CommandInfo, session: Any
     ) -> Dict[str, Any]:
         """Handle database operations"""
         results: Dict[str, Any] = {}
 
         try:
             # Get cluster name - required for all database operations
-            cluster_name = command_info.get("cluster_name")
+            cluster_name = command_info.cluster_name
             if not cluster_name:
                 results["error"] = (
                     "Cluster name required for database operations. Please specify which cluster to use."
@@ -353,26 +751,26 @@ class MongoCommandHandler:
 
             # Connect to the specified cluster first
             connection_params = {"cluster": cluster_name}
-            await self.mcp_session.call_tool("connect", connection_params)
+            await session.call_tool("connect", connection_params)
             results["cluster_connected"] = cluster_name
 
             if action == "list_databases":
-                databases = await self.mcp_session.call_tool("list-databases", {})
+                databases = await session.call_tool("list-databases", {})
                 results["databases"] = databases
 
             elif action == "list_collections":
-                if command_info.get("database"):
-                    collections = await self.mcp_session.call_tool(
-                        "list-collections", {"database": command_info["database"]}
+                if command_info.database:
+                    collections = await session.call_tool(
+                        "list-collections", {"database": command_info.database}
                     )
                     results["collections"] = collections
                 else:
                     results["error"] = "Database name required"
 
             elif action == "schema_analysis":
-                if command_info.get("collection"):
-                    schema = await self.mcp_session.call_tool(
-                        "collection-schema", {"collection": command_info["collection"]}
+                if command_info.collection:
+                    schema = await session.call_tool(
+                        "collection-schema", {"collection": command_info.collection}
                     )
                     results["schema"] = schema
                 else:
@@ -384,15 +782,44 @@ class MongoCommandHandler:
 
         return results
 
+    async def _gather_collection_indexes(self, collection_list, session):
+        """Fetch collection-indexes for every collection concurrently.
+
+        Each call is a network round-trip to the MCP server, so issuing them
+        with asyncio.gather collapses N sequential round-trips into roughly
+        one. A semaphore caps in-flight requests to avoid overwhelming the
+        server on large clusters. Collections whose fetch failed are logged
+        and skipped rather than failing the whole analysis.
+        """
+        semaphore = asyncio.Semaphore(8)
+
+        async def fetch(collection):
+            async with semaphore:
+                return await session.call_tool(
+                    "collection-indexes", {"collection": collection}
+                )
+
+        fetched = await asyncio.gather(
+            *(fetch(collection) for collection in collection_list),
+            return_exceptions=True,
+        )
+        pairs = []
+        for collection, indexes in zip(collection_list, fetched):
+            if isinstance(indexes, Exception):
+                logger.error(f"Error fetching indexes for {collection}: {indexes}")
+                continue
+            pairs.append((collection, indexes))
+        return pairs
+
     async def _handle_optimization(
-        self, action: str, command_info: Dict[str, Any]
+        self, action: str, command_info: CommandInfo, session: Any
     ) -> Dict[str, Any]:
         """Handle optimization commands"""
         results: Dict[str, Any] = {}
 
         try:
             # Get cluster name - required for all optimization operations
-            cluster_name = command_info.get("cluster_name")
+            cluster_name = command_info.cluster_name
             if not cluster_name:
                 results["error"] = (
                     "Cluster name required for optimization operations. Please specify which cluster to use."
@@ -401,40 +828,39 @@ class MongoCommandHandler:
 
             # Connect to the specified cluster first
             connection_params = {"cluster": cluster_name}
-            await self.mcp_session.call_tool("connect", connection_params)
+            await session.call_tool("connect", connection_params)
             results["cluster_connected"] = cluster_name
 
             if action == "missing_indexes":
                 # Get all collections
-                collections = await self.mcp_session.call_tool("list-collections", {})
+                collections = await session.call_tool("list-collections", {})
                 results["collections"] = collections
 
-                # For each collection, analyze indexes
+                # Fetch indexes for all collections concurrently
                 if collections and hasattr(collections, "content"):
-                    collection_data = json.loads(collections.content[0].text)
-                    for collection in collection_data.get("collections", []):
-                        indexes = await self.mcp_session.call_tool(
-                            "collection-indexes", {"collection": collection}
-                        )
+                    collection_data = _json_loads(collections.content[0].text)
+                    collection_list = collection_data.get("collections", [])
+                    for collection, indexes in await self._gather_collection_indexes(
+                        collection_list, session
+                    ):
                         results[f"{collection}_indexes"] = indexes
 
             elif action == "redundant_indexes":
                 # Get all collections
-                collections = await self.mcp_session.call_tool("list-collections", {})
+                collections = await session.call_tool("list-collections", {})
                 results["collections"] = collections
 
                 redundant_indexes = {}
 
-                # For each collection, analyze indexes for redundancy
+                # Fetch all indexes concurrently, then analyze for redundancy
                 if collections and hasattr(collections, "content"):
-                    collection_data = json.loads(collections.content[0].text)
-                    for collection in collection_data.get("collections", []):
-                        indexes = await self.mcp_session.call_tool(
-                            "collection-indexes", {"collection": collection}
-                        )
-
+                    collection_data = _json_loads(collections.content[0].text)
+                    collection_list = collection_data.get("collections", [])
+                    for collection, indexes in await self._gather_collection_indexes(
+                        collection_list, session
+                    ):
                         if indexes and hasattr(indexes, "content"):
-                            index_data = json.loads(indexes.content[0].text)
+                            index_data = _json_loads(indexes.content[0].text)
                             redundant = await self._analyze_redundant_indexes(
                                 collection, index_data
                             )
@@ -450,21 +876,23 @@ class MongoCommandHandler:
 
         return results
 
-    async def _handle_security(self, action: str, command_info: Dict[str, Any]) -> Dict[str, Any]:
+    async def _handle_security(
+        self, action: str, command_info: CommandInfo, session: Any
+    ) -> Dict[str, Any]:
         """Handle security commands"""
         results: Dict[str, Any] = {}
 
         if action == "add_ip_whitelist":
             try:
                 # First, get current access lists
-                access_lists = await self.mcp_session.call_tool("atlas-inspect-access-list", {})
+                access_lists = await session.call_tool("atlas-inspect-access-list", {})
                 results["current_access_lists"] = access_lists
 
                 # Add IP if provided
-                if command_info.get("ip_address"):
-                    new_access = await self.mcp_session.call_tool(
+                if command_info.ip_address:
+                    new_access = await session.call_tool(
                         "atlas-create-access-list",
-                        {"ipAddress": command_info["ip_address"], "comment": "Added via Slack bot"},
+                        {"ipAddress": command_info.ip_address, "comment": "Added via Slack bot"},
                     )
                     results["new_access_entry"] = new_access
 
@@ -475,7 +903,7 @@ class MongoCommandHandler:
         elif action == "reset_password":
             try:
                 # List users first
-                users = await self.mcp_session.call_tool("atlas-list-db-users", {})
+                users = await session.call_tool("atlas-list-db-users", {})
                 results["users"] = users
 
             except Exception as e:
@@ -485,7 +913,7 @@ class MongoCommandHandler:
         return results
 
     async def _handle_rbac_commands(
-        self, action: str, command_info: Dict[str, Any]
+        self, action: str, command_info: CommandInfo, session: Any
     ) -> Dict[str, Any]:
         """Handle RBAC-related commands"""
         results: Dict[str, Any] = {}
@@ -516,8 +944,16 @@ class MongoCommandHandler:
             if not indexes:
                 return redundant_indexes
 
-            # Parse indexes into a more analyzable format
-            parsed_indexes = []
+            # Parse indexes into a struct-of-arrays layout: parallel lists of
+            # names, field tuples, and direction tuples. Field names are
+            # interned to small ints per collection, so the bucket hashing and
+            # tuple comparisons below run over machine ints instead of
+            # strings; only index names survive into the output, so the
+            # encoding never needs to be reversed.
+            field_id: Dict[str, int] = {}
+            names: List[str] = []
+            field_tuples: List[tuple] = []
+            dir_tuples: List[tuple] = []
             for idx in indexes:
                 if isinstance(idx, dict):
                     name = idx.get("name", "")
@@ -527,39 +963,57 @@ class MongoCommandHandler:
                     if name == "_id_":
                         continue
 
-                    # Extract field names and directions
-                    fields = []
-                    for field, direction in key.items():
-                        fields.append({"field": field, "direction": direction})
-
-                    parsed_indexes.append(
+                    names.append(name)
+                    field_tuples.append(
+                        tuple(field_id.setdefault(field, len(field_id)) for field in key)
+                    )
+                    dir_tuples.append(tuple(key.values()))
+
+            # Collect candidate pairs with hashed buckets instead of the old
+            # all-pairs double loop; _check_index_redundancy then confirms and
+            # classifies only the pairs that can actually be redundant.
+            candidate_pairs: set[tuple[int, int]] = set()
+
+            # Exact duplicates: bucket by the full (fields, directions) key
+            by_key: Dict[tuple, List[int]] = {}
+            for pos in range(len(names)):
+                by_key.setdefault((field_tuples[pos], dir_tuples[pos]), []).append(pos)
+            for bucket in by_key.values():
+                candidate_pairs.update(combinations(bucket, 2))
+
+            # Reverse duplicates: bucket single-field indexes by field id
+            by_single_field: Dict[int, List[int]] = {}
+            for pos, fields in enumerate(field_tuples):
+                if len(fields) == 1:
+                    by_single_field.setdefault(fields[0], []).append(pos)
+            for bucket in by_single_field.values():
+                candidate_pairs.update(combinations(bucket, 2))
+
+            # Prefix redundancy: sort by field-id tuple so every index that
+            # extends a given prefix sorts directly after it
+            order = sorted(range(len(names)), key=field_tuples.__getitem__)
+            for rank, pos in enumerate(order):
+                prefix = field_tuples[pos]
+                for other in islice(order, rank + 1, None):
+                    other_fields = field_tuples[other]
+                    if other_fields[: len(prefix)] != prefix:
+                        break
+                    if len(other_fields) > len(prefix):
+                        candidate_pairs.add((min(pos, other), max(pos, other)))
+
+            for i, j in sorted(candidate_pairs):
+                redundancy = self._check_index_redundancy(i, j, names, field_tuples, dir_tuples)
+                if redundancy:
+                    redundant_indexes.append(
                         {
-                            "name": name,
-                            "fields": fields,
-                            "field_names": [f["field"] for f in fields],
-                            "key": key,
-                            "original": idx,
+                            "collection": collection_name,
+                            "redundant_index": redundancy["redundant"],
+                            "covers_same_as": redundancy["covers"],
+                            "redundancy_type": redundancy["type"],
+                            "recommendation": redundancy["recommendation"],
                         }
                     )
 
-            # Find redundant indexes
-            for i, idx1 in enumerate(parsed_indexes):
-                for j, idx2 in enumerate(parsed_indexes):
-                    if i >= j:  # Skip self-comparison and duplicates
-                        continue
-
-                    redundancy = self._check_index_redundancy(idx1, idx2)
-                    if redundancy:
-                        redundant_indexes.append(
-                            {
-                                "collection": collection_name,
-                                "redundant_index": redundancy["redundant"],
-                                "covers_same_as": redundancy["covers"],
-                                "redundancy_type": redundancy["type"],
-                                "recommendation": redundancy["recommendation"],
-                            }
-                        )
-
             return redundant_indexes
 
         except Exception as e:
@@ -567,59 +1021,61 @@ class MongoCommandHandler:
             return []
 
     def _check_index_redundancy(
-        self, idx1: Dict[str, Any], idx2: Dict[str, Any]
+        self,
+        i: int,
+        j: int,
+        names: List[str],
+        field_tuples: List[tuple],
+        dir_tuples: List[tuple],
     ) -> Optional[Dict[str, Any]]:
-        """Check if two indexes are redundant"""
+        """Check if indexes at positions i and j are redundant"""
 
         # Type 1: Exact duplicate (same fields, same order, same direction)
-        if idx1["field_names"] == idx2["field_names"]:
-            if all(
-                f1["direction"] == f2["direction"] for f1, f2 in zip(idx1["fields"], idx2["fields"])
-            ):
-                return {
-                    "redundant": idx1["name"],
-                    "covers": idx2["name"],
-                    "type": "exact_duplicate",
-                    "recommendation": f"Remove index '{idx1['name']}' as it's identical to '{idx2['name']}'",
-                }
+        if field_tuples[i] == field_tuples[j] and dir_tuples[i] == dir_tuples[j]:
+            return {
+                "redundant": names[i],
+                "covers": names[j],
+                "type": "exact_duplicate",
+                "recommendation": f"Remove index '{names[i]}' as it's identical to '{names[j]}'",
+            }
 
         # Type 2: Prefix redundancy (one index is a prefix of another)
-        if self._is_prefix_redundant(idx1, idx2):
+        if self._is_prefix_redundant(field_tuples[i], dir_tuples[i], field_tuples[j], dir_tuples[j]):
             return {
-                "redundant": idx1["name"],
-                "covers": idx2["name"],
+                "redundant": names[i],
+                "covers": names[j],
                 "type": "prefix_redundant",
                 "recommendation": (
-                    f"Consider removing index '{idx1['name']}' as it's covered by '{idx2['name']}'"
+                    f"Consider removing index '{names[i]}' as it's covered by '{names[j]}'"
                 ),
             }
 
-        if self._is_prefix_redundant(idx2, idx1):
+        if self._is_prefix_redundant(field_tuples[j], dir_tuples[j], field_tuples[i], dir_tuples[i]):
             return {
-                "redundant": idx2["name"],
-                "covers": idx1["name"],
+                "redundant": names[j],
+                "covers": names[i],
                 "type": "prefix_redundant",
                 "recommendation": (
-                    f"Consider removing index '{idx2['name']}' as it's covered by '{idx1['name']}'"
+                    f"Consider removing index '{names[j]}' as it's covered by '{names[i]}'"
                 ),
             }
 
         # Type 3: Reverse redundancy (same fields, opposite directions)
         if (
-            idx1["field_names"] == idx2["field_names"]
-            and len(idx1["fields"]) == 1
-            and len(idx2["fields"]) == 1
+            field_tuples[i] == field_tuples[j]
+            and len(field_tuples[i]) == 1
+            and len(field_tuples[j]) == 1
         ):
-            f1_dir = idx1["fields"][0]["direction"]
-            f2_dir = idx2["fields"][0]["direction"]
+            i_dir = dir_tuples[i][0]
+            j_dir = dir_tuples[j][0]
 
-            if (f1_dir == 1 and f2_dir == -1) or (f1_dir == -1 and f2_dir == 1):
+            if (i_dir == 1 and j_dir == -1) or (i_dir == -1 and j_dir == 1):
                 return {
-                    "redundant": idx1["name"],
-                    "covers": idx2["name"],
+                    "redundant": names[i],
+                    "covers": names[j],
                     "type": "reverse_redundant",
                     "recommendation": (
-                        f"Indexes '{idx1['name']}' and '{idx2['name']}' are reverse duplicates. "
+                        f"Indexes '{names[i]}' and '{names[j]}' are reverse duplicates. "
                         f"Consider keeping only one unless both sort orders are frequently used."
                     ),
                 }
@@ -627,58 +1083,22 @@ class MongoCommandHandler:
         return None
 
     def _is_prefix_redundant(
-        self, potential_redundant: Dict[str, Any], covering_index: Dict[str, Any]
+        self,
+        redundant_fields: tuple,
+        redundant_dirs: tuple,
+        covering_fields: tuple,
+        covering_dirs: tuple,
     ) -> bool:
-        """Check if potential_redundant is a prefix of covering_index"""
-        redundant_fields = potential_redundant["field_names"]
-        covering_fields = covering_index["field_names"]
-
-        if len(redundant_fields) >= len(covering_fields):
-            return False
-
-        # Check if redundant fields are a prefix of covering fields
-        for i, field in enumerate(redundant_fields):
-            if i >= len(covering_fields) or covering_fields[i] != field:
-                return False
-
-            # Check if directions match
-            if (
-                potential_redundant["fields"][i]["direction"]
-                != covering_index["fields"][i]["direction"]
-            ):
-                return False
-
-        return True
+        """Check if the first index is a prefix of the covering index"""
+        # Tuple slicing and equality dispatch to C-level comparisons, far
+        # cheaper than a per-field Python loop
+        width = len(redundant_fields)
+        return (
+            width < len(covering_fields)
+            and covering_fields[:width] == redundant_fields
+            and covering_dirs[:width] == redundant_dirs
+        )
 
     def _get_help_text(self) -> str:
         """Get help text for the bot"""
-        return """
-🤖 **MongoDB Atlas Assistant Help**
-
-**Atlas Management:**
-• List my clusters
-• Create a new cluster called [name]
-• Show cluster details for [cluster]
-
-**Performance Analysis:**
-• Analyze cluster [name] performance over last [time]
-• Show slow queries on cluster [name]
-• Performance summary for [cluster]
-
-**Database Operations:**
-• List all databases
-• Show collections in database [name]
-• Analyze schema for collection [name]
-
-**Security:**
-• Add IP [address] to whitelist
-• Reset password for user [name]
-
-**Optimization:**
-• Find missing indexes in database [name]
-• Find redundant indexes in database [name]
-• Show duplicate indexes
-• Storage usage analysis
-
-Use natural language - I'll understand your intent!
-        """
+        return _HELP_TEXT
@@ -9,10 +9,21 @@ import json
 import logging
 import os
 import re
+import string
+import time
+from contextlib import AsyncExitStack, asynccontextmanager
 from datetime import datetime
+from typing import List, Optional
 
 import anthropic
-from mcp import StdioServerParameters
+
+try:  # orjson serializes large MCP payloads roughly 10x faster when installed
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+from mcp import ClientSession, StdioServerParameters
+from pydantic import BaseModel
 from mcp.client.stdio import stdio_client
 from slack_bolt.adapter.socket_mode.async_handler import AsyncSocketModeHandler
 from slack_bolt.async_app import AsyncApp
@@ -25,73 +36,367 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+class MongoBotConfig(BaseModel):
+    """Runtime configuration, read from the environment exactly once.
+
+    Validating up front gives a fail-fast error listing every missing
+    variable, instead of discovering them one at a time on the first Slack
+    API call or after an npx subprocess has already been spawned. (A
+    pydantic-settings BaseSettings model would read the environment itself,
+    but that package is not a dependency here, so a plain model with an
+    explicit from_env is used.)
+    """
+
+    slack_bot_token: Optional[str] = None
+    slack_app_token: Optional[str] = None
+    slack_signing_secret: Optional[str] = None
+    anthropic_api_key: Optional[str] = None
+    mongodb_atlas_client_id: Optional[str] = None
+    mongodb_atlas_client_secret: Optional[str] = None
+    mongodb_connection_string: str = ""
+    mcp_log_path: str = "/tmp/mcp-logs"
+    mcp_pool_size: int = 4
+
+    @classmethod
+    def from_env(cls) -> "MongoBotConfig":
+        return cls(
+            slack_bot_token=os.environ.get("SLACK_BOT_TOKEN"),
+            slack_app_token=os.environ.get("SLACK_APP_TOKEN"),
+            slack_signing_secret=os.environ.get("SLACK_SIGNING_SECRET"),
+            anthropic_api_key=os.environ.get("ANTHROPIC_API_KEY"),
+            mongodb_atlas_client_id=os.environ.get("MONGODB_ATLAS_CLIENT_ID"),
+            mongodb_atlas_client_secret=os.environ.get("MONGODB_ATLAS_CLIENT_SECRET"),
+            mongodb_connection_string=os.environ.get("MONGODB_CONNECTION_STRING", ""),
+            mcp_log_path=os.environ.get("MDB_MCP_LOG_PATH", "/tmp/mcp-logs"),
+            mcp_pool_size=int(os.environ.get("MCP_POOL_SIZE", "4")),
+        )
+
+    def missing_required(self) -> List[str]:
+        """Names of required environment variables that are unset"""
+        required = {
+            "SLACK_BOT_TOKEN": self.slack_bot_token,
+            "SLACK_APP_TOKEN": self.slack_app_token,
+            "SLACK_SIGNING_SECRET": self.slack_signing_secret,
+            "ANTHROPIC_API_KEY": self.anthropic_api_key,
+            "MONGODB_ATLAS_CLIENT_ID": self.mongodb_atlas_client_id,
+            "MONGODB_ATLAS_CLIENT_SECRET": self.mongodb_atlas_client_secret,
+        }
+        return [name for name, value in required.items() if not value]
+
+
+class MCPSessionPool:
+    """Small pool of MCP stdio sessions behind an asyncio.Queue.
+
+    A single stdio session serializes every tool call, so bursts of Slack
+    commands would queue behind one pipe. Members are checked out per
+    command and returned afterwards, which allows up to pool-size commands
+    in flight while preserving the session affinity that stateful tools
+    like connect rely on. call_tool/list_tools mirror the surface of a
+    plain session, so the pool is a drop-in replacement.
+    """
+
+    def __init__(self, sessions):
+        self._sessions = list(sessions)
+        self._queue: asyncio.Queue = asyncio.Queue()
+        for session in self._sessions:
+            self._queue.put_nowait(session)
+
+    @asynccontextmanager
+    async def checkout(self):
+        """Borrow one session for a sequence of related calls"""
+        session = await self._queue.get()
+        try:
+            yield session
+        finally:
+            self._queue.put_nowait(session)
+
+    async def call_tool(self, tool_name, params):
+        async with self.checkout() as session:
+            return await session.call_tool(tool_name, params)
+
+    async def list_tools(self):
+        async with self.checkout() as session:
+            return await session.list_tools()
+
+
+# Operations that gate themselves (help is personalized per role, and the
+# RBAC command handlers check is_user_admin directly), so the generic
+# permission check would only add a redundant Slack round-trip
+_BYPASS_OPS = frozenset({"help", "rbac_report", "list_admins", "check_permissions"})
+
+# Claude formatting prompt, parsed into a Template once at import; only
+# five fields vary per request
+_SYSTEM_PROMPT = string.Template(
+    """You are a MongoDB Atlas assistant formatting results for Slack.
+
+Original command: $user_message
+Command category: $category
+Command action: $action
+User permission level: $reason
+
+Available MCP tools: $tools
+
+Format the results clearly for Slack with:
+- Use emojis for visual appeal (🚀 for clusters, 🔍 for analysis, 📊 for data, ⚠️ for warnings, ❌ for errors)
+- Use code blocks for technical data
+- Use bullet points for lists
+- Keep it concise but informative
+- If there are errors, explain them clearly and suggest solutions
+- For performance analysis, provide actionable insights
+- For database operations, summarize key findings
+
+Present the data in a way that's easy to understand for technical teams."""
+)
+
+# Denial message shell, formatted per incident with format_map
+_DENIED_TEMPLATE = """🚫 **Access Denied**
+
+**User:** @{username}
+**Operation:** `{operation}`
+**Reason:** {reason}
+
+**What you can do:**
+• Use `help` to see available commands for your role
+• Contact an administrator for elevated access
+• Try read-only operations like `list clusters` or `analyze performance`
+
+**Administrators:** {admins}
+"""
+
+
+def _dumps_indented(obj) -> str:
+    """Serialize obj to indented JSON, preferring orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2)
+
+
+# Role-specific help text, allocated once at import
+_ADMIN_HELP = """🤖 **MongoDB Atlas Assistant - Admin Access**
+
+**📋 Available Commands:**
+
+**🚀 Atlas Management (Admin):**
+• `List my clusters` - View all clusters
+• `Create a new cluster called [name]` - Create new cluster
+• `Show cluster details for [cluster]` - Cluster information
+
+**🔒 Security Management (Admin):**
+• `Add IP [address] to whitelist` - Manage IP access
+• `Reset password for user [name]` - Reset user passwords
+• `Create database user [name]` - Create new users
+
+**🔧 Database Operations (Admin):**
+• `Create index on [collection] for [field]` - Index management
+• `Insert document into [collection]` - Add documents
+• `Update documents in [collection]` - Modify documents
+• `Delete documents from [collection]` - Remove documents
+
+**📊 Analysis & Monitoring (All Users):**
+• `Analyze cluster [name] performance` - Performance analysis
+• `Show slow queries on cluster [name]` - Query analysis
+• `Find missing indexes in [database]` - Optimization
+• `List databases` - View databases
+• `Show collections in [database]` - View collections
+
+**🔐 Admin Privileges Active** - You have full access to all operations."""
+
+_USER_HELP = """🤖 **MongoDB Atlas Assistant - User Access**
+
+**📋 Available Commands:**
+
+**📊 Analysis & Monitoring:**
+• `List my clusters` - View cluster information
+• `Analyze cluster [name] performance` - Performance analysis
+• `Show slow queries on cluster [name]` - Query analysis
+• `Find missing indexes in [database]` - Index optimization
+
+**🔍 Database Information:**
+• `List databases` - View available databases
+• `Show collections in [database]` - View collections
+• `Analyze schema for collection [name]` - Schema analysis
+• `Show database statistics` - Database metrics
+
+**📈 Performance Analysis:**
+• `Performance issues on [cluster]` - Cluster analysis
+• `Storage usage analysis` - Storage metrics
+• `Query patterns analysis` - Query optimization
+
+**ℹ️ User Access** - For admin operations (create/update/delete), please contact an administrator."""
+
+
 class MongoSlackBot:
-    def __init__(self):
+    def __init__(self, config: Optional[MongoBotConfig] = None):
+        # Runtime configuration, resolved once
+        self.config = config or MongoBotConfig.from_env()
+
         # Initialize Slack app
         self.app = AsyncApp(
-            token=os.environ.get("SLACK_BOT_TOKEN"),
-            signing_secret=os.environ.get("SLACK_SIGNING_SECRET"),
+            token=self.config.slack_bot_token,
+            signing_secret=self.config.slack_signing_secret,
         )
 
-        # Initialize Claude client
-        self.claude_client = anthropic.Anthropic(api_key=os.environ.get("ANTHROPIC_API_KEY"))
+        # Claude client, constructed lazily on first formatting request
+        self._claude_client = None
 
-        # MCP session
+        # MCP session, established lazily on the first command that needs it;
+        # the exit stack owns the stdio transports and sessions behind the
+        # pool, keeping them open for its lifetime
         self.mcp_session = None
+        self._mcp_exit_stack: Optional[AsyncExitStack] = None
+        self._server_params = None  # built once on first MCP setup
 
-        # Command handler
-        self.command_handler = None
+        # Backoff state so a broken MCP server is not respawned for every
+        # inbound message; one setup attempt at a time, retried with
+        # exponential delay capped at a minute
+        self._mcp_setup_lock = asyncio.Lock()
+        self._mcp_next_retry_ts = 0.0
+        self._mcp_backoff = 5.0
+
+        # Command handler; categorization works immediately, the MCP session
+        # is attached once the first tool-backed command arrives
+        self.command_handler = MongoCommandHandler(None)
 
         # RBAC manager
-        self.rbac_manager = None
+        self.rbac_manager: Optional[RBACManager] = None
 
-        # Bot user ID
+        # Bot user ID and the compiled mention pattern derived from it
         self.bot_user_id = None
+        self._mention_re = None
+
+        # Strong reference to the RBAC cache-priming task; the event loop
+        # only holds weak task references
+        self._rbac_prime_task: Optional[asyncio.Task] = None
+
+        # Lazy-init guard: auth_test and RBACManager construction must run
+        # exactly once even when the first Slack events arrive concurrently
+        self._init_lock = asyncio.Lock()
+        self._initialized = False
+
+        # RBAC decisions cached per user so repeat messages skip the Slack
+        # round-trips inside check_user_permission / is_user_admin. Same
+        # manual TTL scheme as the membership caches in RBACManager.
+        self._permission_cache: dict = {}
+        self._admin_cache: dict = {}
+        self._rbac_cache_ttl = 300  # 5 minutes
 
         # Setup event handlers
         self.setup_handlers()
 
+    @property
+    def claude_client(self):
+        """Anthropic client, created on first use"""
+        if self._claude_client is None:
+            self._claude_client = anthropic.AsyncAnthropic(api_key=self.config.anthropic_api_key)
+        return self._claude_client
+
+    def _build_server_params(self) -> StdioServerParameters:
+        """Build the MCP server parameters once; reused across retries"""
+        # Read each value once and coerce None to "" so a missing credential
+        # cannot crash StdioServerParameters construction
+        client_id = self.config.mongodb_atlas_client_id or ""
+        client_secret = self.config.mongodb_atlas_client_secret or ""
+        conn_str = self.config.mongodb_connection_string or ""
+        log_path = self.config.mcp_log_path
+
+        return StdioServerParameters(
+            command="npx",
+            args=[
+                "-y",
+                "mongodb-mcp-server",
+                "--apiClientId",
+                client_id,
+                "--apiClientSecret",
+                client_secret,
+                "--connectionString",
+                conn_str,
+                "--logPath",
+                log_path,
+            ],
+            env={
+                "MDB_MCP_API_CLIENT_ID": client_id,
+                "MDB_MCP_API_CLIENT_SECRET": client_secret,
+                "MDB_MCP_CONNECTION_STRING": conn_str,
+                "MDB_MCP_LOG_PATH": log_path,
+            },
+        )
+
+    async def _ensure_mcp_connection(self) -> bool:
+        """Establish the MCP connection if needed, with retry backoff.
+
+        Returns True when a session is available. After a failed attempt,
+        further attempts are suppressed until the backoff window expires, so
+        message bursts during an outage cannot fork a pile of npx processes.
+        """
+        if self.mcp_session:
+            return True
+        if time.monotonic() < self._mcp_next_retry_ts:
+            return False
+        async with self._mcp_setup_lock:
+            if self.mcp_session:
+                return True
+            if time.monotonic() < self._mcp_next_retry_ts:
+                return False
+            if await self.setup_mcp_connection():
+                self._mcp_backoff = 5.0
+                return True
+            self._mcp_next_retry_ts = time.monotonic() + self._mcp_backoff
+            self._mcp_backoff = min(self._mcp_backoff * 2, 60.0)
+            return False
+
+    @staticmethod
+    async def _open_mcp_session(server_params, stack: AsyncExitStack) -> ClientSession:
+        """Open one stdio transport plus initialized session on the exit stack"""
+        read, write = await stack.enter_async_context(stdio_client(server_params))
+        session = await stack.enter_async_context(ClientSession(read, write))
+        await session.initialize()
+        return session
+
     async def setup_mcp_connection(self):
         """Setup connection to MongoDB MCP server"""
         try:
             # MCP server parameters
-            server_params = StdioServerParameters(
-                command="npx",
-                args=[
-                    "-y",
-                    "mongodb-mcp-server",
-                    "--apiClientId",
-                    os.environ.get("MONGODB_ATLAS_CLIENT_ID"),
-                    "--apiClientSecret",
-                    os.environ.get("MONGODB_ATLAS_CLIENT_SECRET"),
-                    "--connectionString",
-                    os.environ.get("MONGODB_CONNECTION_STRING", ""),
-                    "--logPath",
-                    "/tmp/mcp-logs",
-                ],
-                env={
-                    "MDB_MCP_API_CLIENT_ID": os.environ.get("MONGODB_ATLAS_CLIENT_ID"),
-                    "MDB_MCP_API_CLIENT_SECRET": os.environ.get("MONGODB_ATLAS_CLIENT_SECRET"),
-                    "MDB_MCP_CONNECTION_STRING": os.environ.get("MONGODB_CONNECTION_STRING", ""),
-                    "MDB_MCP_LOG_PATH": "/tmp/mcp-logs",
-                },
-            )
-
-            # Create MCP client session
-            self.mcp_session = await stdio_client(server_params)
-
-            # Initialize command handler
-            self.command_handler = MongoCommandHandler(self.mcp_session)
+            if self._server_params is None:
+                self._server_params = self._build_server_params()
+            server_params = self._server_params
+
+            # Create a pool of MCP client sessions so concurrent commands
+            # are not serialized through a single stdio pipe. stdio_client
+            # and ClientSession are async context managers whose transports
+            # must outlive this call, so each member is entered onto the
+            # exit stack; members are opened one at a time because the
+            # stack is not safe for concurrent entry
+            self._mcp_exit_stack = stack = AsyncExitStack()
+            sessions = [
+                await self._open_mcp_session(server_params, stack)
+                for _ in range(self.config.mcp_pool_size)
+            ]
+            self.mcp_session = MCPSessionPool(sessions)
+
+            # Attach the session to the command handler
+            self.command_handler.mcp_session = self.mcp_session
             await self.command_handler.refresh_tools()
 
-            # List available tools
-            tools_response = await self.mcp_session.list_tools()
-            logger.info(f"Available MCP tools: {[tool.name for tool in tools_response.tools]}")
+            # List available tools; the list comprehension only runs when
+            # INFO records will actually be emitted
+            if logger.isEnabledFor(logging.INFO):
+                tools_response = await self.mcp_session.list_tools()
+                logger.info("Available MCP tools: %s", [tool.name for tool in tools_response.tools])
 
             return True
 
         except Exception as e:
-            logger.error(f"Failed to setup MCP connection: {e}")
+            logger.error("Failed to setup MCP connection: %s", e)
+            # Tear down any members that did come up so a half-built pool
+            # doesn't leak npx processes between retries
+            if self._mcp_exit_stack is not None:
+                try:
+                    await self._mcp_exit_stack.aclose()
+                except Exception as close_error:
+                    logger.error("Error closing partial MCP pool: %s", close_error)
+                self._mcp_exit_stack = None
+            self.mcp_session = None
+            self.command_handler.mcp_session = None
             return False
 
     def setup_handlers(self):
@@ -127,25 +432,50 @@ class MongoSlackBot:
 
             await self.process_message(mock_event, mock_say, client)
 
+    async def _ensure_initialized(self, client):
+        """Resolve the bot user and build the RBAC manager exactly once.
+
+        Without the lock, a burst of events on cold start would fire one
+        auth_test per in-flight message.
+        """
+        if self._initialized:
+            return
+        async with self._init_lock:
+            if self._initialized:
+                return
+            auth_response = await client.auth_test()
+            self.bot_user_id = auth_response["user_id"]
+            # bot_user_id is fixed from here on, so compile the mention
+            # pattern once instead of per message
+            self._mention_re = re.compile(rf"<@{re.escape(self.bot_user_id)}>")
+            self.rbac_manager = RBACManager(client)
+            # Warm the RBAC caches in the background so the first
+            # permission-checked command doesn't pay the Slack lookups;
+            # keep the reference so the task can't be garbage-collected
+            # mid-flight, and log failures that prime_caches' own error
+            # handling never saw (e.g. an exception before its gather)
+            self._rbac_prime_task = asyncio.create_task(self.rbac_manager.prime_caches())
+            self._rbac_prime_task.add_done_callback(self._log_prime_caches_result)
+            self._initialized = True
+
+    @staticmethod
+    def _log_prime_caches_result(task: asyncio.Task):
+        """Surface errors from the background RBAC cache warm-up"""
+        if not task.cancelled() and task.exception() is not None:
+            logger.error("RBAC cache priming failed: %s", task.exception())
+
     async def process_message(self, event, say, client):
         """Process incoming messages and route to appropriate handlers"""
         try:
-            # Get bot user ID if not cached
-            if not self.bot_user_id:
-                auth_response = await client.auth_test()
-                self.bot_user_id = auth_response["user_id"]
-
-            # Initialize RBAC manager if not already done
-            if not self.rbac_manager:
-                self.rbac_manager = RBACManager(client)
+            await self._ensure_initialized(client)
 
             # Extract message text
             text = event.get("text", "").strip()
             user_id = event.get("user")
 
-            # Remove bot mention if present
-            if f"<@{self.bot_user_id}>" in text:
-                text = re.sub(f"<@{self.bot_user_id}>", "", text).strip()
+            # Remove bot mention if present; sub is a no-op when absent, so
+            # one scan replaces the separate membership test plus re.sub
+            text = self._mention_re.sub("", text).strip()
 
             if not text:
                 # Show available commands based on user permissions
@@ -153,73 +483,104 @@ class MongoSlackBot:
                 await say(help_message)
                 return
 
-            # Show typing indicator
-            await say("🔍 Analyzing your request...")
-
-            # Setup MCP connection if not already done
-            if not self.mcp_session:
-                await self.setup_mcp_connection()
+            # Fire the typing indicator without blocking analysis; the
+            # Slack round-trip overlaps categorization and RBAC checks
+            typing_task = asyncio.create_task(say("🔍 Analyzing your request..."))
 
-            # Process the command using Claude + MCP with RBAC
-            response = await self.process_with_claude_and_mcp(text, user_id)
+            try:
+                # Process the command using Claude + MCP with RBAC
+                response = await self.process_with_claude_and_mcp(text, user_id)
+            finally:
+                # The indicator must land before the final response so the
+                # conversation stays ordered
+                await typing_task
 
             # Send response back to Slack
             await say(response)
 
         except Exception as e:
-            logger.error(f"Error processing message: {e}")
+            logger.error("Error processing message: %s", e, exc_info=True)
             await say(f"❌ Sorry, I encountered an error: {str(e)}")
 
+    def _require_rbac(self) -> RBACManager:
+        """Return the RBAC manager; _ensure_initialized builds it before any
+        message handler can reach the methods that call this"""
+        if self.rbac_manager is None:
+            raise RuntimeError("RBAC manager not initialized")
+        return self.rbac_manager
+
+    async def _check_user_permission_cached(self, user_id: str, operation: str):
+        """check_user_permission with a per-(user, operation) TTL cache"""
+        key = (user_id, operation)
+        cached = self._permission_cache.get(key)
+        now = time.monotonic()
+        if cached and now < cached[0]:
+            return cached[1]
+
+        decision = await self._require_rbac().check_user_permission(user_id, operation)
+        self._permission_cache[key] = (now + self._rbac_cache_ttl, decision)
+        return decision
+
+    async def _is_user_admin_cached(self, user_id: str) -> bool:
+        """is_user_admin with a per-user TTL cache"""
+        cached = self._admin_cache.get(user_id)
+        now = time.monotonic()
+        if cached and now < cached[0]:
+            return cached[1]
+
+        is_admin = await self._require_rbac().is_user_admin(user_id)
+        self._admin_cache[user_id] = (now + self._rbac_cache_ttl, is_admin)
+        return is_admin
+
+    def clear_rbac_caches(self):
+        """Drop cached RBAC decisions, e.g. after admin membership changes"""
+        self._permission_cache.clear()
+        self._admin_cache.clear()
+
     async def process_with_claude_and_mcp(self, user_message: str, user_id: str) -> str:
         """Process user message using Claude LLM and MCP tools with RBAC"""
         try:
             # Use command handler to analyze and categorize the request
             command_info = self.command_handler.categorize_command(user_message)
-            logger.info(f"Command categorized as: {command_info}")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Command categorized as: %s", command_info)
 
             # If it's a help request, return personalized help
-            if command_info["action"] == "help":
+            if command_info.action == "help":
                 return await self.get_personalized_help(user_id)
 
+            operation = command_info.action
+
+            # RBAC commands are dispatched before the generic permission
+            # check: their handlers enforce admin gating themselves
+            if command_info.category == "rbac" or operation in _BYPASS_OPS:
+                return await self.handle_rbac_command(user_id, operation)
+
             # Check user permissions for this operation
-            operation = command_info["action"]
-            permission_check = await self.rbac_manager.check_user_permission(user_id, operation)
+            permission_check = await self._check_user_permission_cached(user_id, operation)
 
             if not permission_check["allowed"]:
                 return await self.handle_permission_denied(
                     user_id, operation, permission_check["reason"]
                 )
 
-            # Handle RBAC commands specially
-            if command_info["category"] == "rbac":
-                return await self.handle_rbac_command(user_id, operation)
+            # Spawning the MCP server is expensive, so connect only for
+            # commands that actually execute MCP tools — help and RBAC
+            # requests above never get here
+            if not await self._ensure_mcp_connection():
+                return "❌ MongoDB tools are currently unavailable. Please try again shortly."
 
             # Execute the command using MCP tools
             mcp_results = await self.command_handler.execute_command(command_info)
 
-            # Get available tools for context
-            available_tools = self.command_handler.available_tools
-
-            # Create system prompt for Claude to format results
-            system_prompt = f"""You are a MongoDB Atlas assistant formatting results for Slack.
-
-Original command: {user_message}
-Command category: {command_info['category']}
-Command action: {command_info['action']}
-User permission level: {permission_check['reason']}
-
-Available MCP tools: {', '.join(available_tools)}
-
-Format the results clearly for Slack with:
-- Use emojis for visual appeal (🚀 for clusters, 🔍 for analysis, 📊 for data, ⚠️ for warnings, ❌ for errors)
-- Use code blocks for technical data
-- Use bullet points for lists
-- Keep it concise but informative
-- If there are errors, explain them clearly and suggest solutions
-- For performance analysis, provide actionable insights
-- For database operations, summarize key findings
-
-Present the data in a way that's easy to understand for technical teams."""
+            # Fill the pre-parsed prompt template
+            system_prompt = _SYSTEM_PROMPT.substitute(
+                user_message=user_message,
+                category=command_info.category,
+                action=command_info.action,
+                reason=permission_check["reason"],
+                tools=self.command_handler.tools_csv,
+            )
 
             # Use Claude to format the results for Slack
             claude_response = await self.claude_client.messages.create(
@@ -229,7 +590,7 @@ Present the data in a way that's easy to understand for technical teams."""
                 messages=[
                     {
                         "role": "user",
-                        "content": f"Format these MCP results for Slack:\n\n{json.dumps(mcp_results, indent=2)}",
+                        "content": f"Format these MCP results for Slack:\n\n{_dumps_indented(mcp_results)}",
                     }
                 ],
             )
@@ -237,69 +598,17 @@ Present the data in a way that's easy to understand for technical teams."""
             return claude_response.content[0].text
 
         except Exception as e:
-            logger.error(f"Error in Claude/MCP processing: {e}")
+            logger.error("Error in Claude/MCP processing: %s", e)
             return f"❌ Error processing request: {str(e)}\n\nTry asking for help to see available commands."
 
     async def get_personalized_help(self, user_id: str) -> str:
         """Get personalized help based on user permissions"""
         try:
-            is_admin = await self.rbac_manager.is_user_admin(user_id)
-
-            if is_admin:
-                return """🤖 **MongoDB Atlas Assistant - Admin Access**
-
-**📋 Available Commands:**
-
-**🚀 Atlas Management (Admin):**
-• `List my clusters` - View all clusters
-• `Create a new cluster called [name]` - Create new cluster
-• `Show cluster details for [cluster]` - Cluster information
-
-**🔒 Security Management (Admin):**
-• `Add IP [address] to whitelist` - Manage IP access
-• `Reset password for user [name]` - Reset user passwords
-• `Create database user [name]` - Create new users
-
-**🔧 Database Operations (Admin):**
-• `Create index on [collection] for [field]` - Index management
-• `Insert document into [collection]` - Add documents
-• `Update documents in [collection]` - Modify documents
-• `Delete documents from [collection]` - Remove documents
-
-**📊 Analysis & Monitoring (All Users):**
-• `Analyze cluster [name] performance` - Performance analysis
-• `Show slow queries on cluster [name]` - Query analysis
-• `Find missing indexes in [database]` - Optimization
-• `List databases` - View databases
-• `Show collections in [database]` - View collections
-
-**🔐 Admin Privileges Active** - You have full access to all operations."""
-            else:
-                return """🤖 **MongoDB Atlas Assistant - User Access**
-
-**📋 Available Commands:**
-
-**📊 Analysis & Monitoring:**
-• `List my clusters` - View cluster information
-• `Analyze cluster [name] performance` - Performance analysis
-• `Show slow queries on cluster [name]` - Query analysis
-• `Find missing indexes in [database]` - Index optimization
-
-**🔍 Database Information:**
-• `List databases` - View available databases
-• `Show collections in [database]` - View collections
-• `Analyze schema for collection [name]` - Schema analysis
-• `Show database statistics` - Database metrics
-
-**📈 Performance Analysis:**
-• `Performance issues on [cluster]` - Cluster analysis
-• `Storage usage analysis` - Storage metrics
-• `Query patterns analysis` - Query optimization
-
-**ℹ️ User Access** - For admin operations (create/update/delete), please contact an administrator."""
+            is_admin = await self._is_user_admin_cached(user_id)
+            return _ADMIN_HELP if is_admin else _USER_HELP
 
         except Exception as e:
-            logger.error(f"Error generating personalized help: {e}")
+            logger.error("Error generating personalized help: %s", e)
             return self.command_handler._get_help_text()
 
     async def handle_permission_denied(self, user_id: str, operation: str, reason: str) -> str:
@@ -309,34 +618,27 @@ Present the data in a way that's easy to understand for technical teams."""
             user_info = await self.app.client.users_info(user=user_id)
             username = user_info["user"]["name"] if user_info["ok"] else user_id
 
-            # Get list of admins
-            admin_info = await self.rbac_manager.get_admin_users_info()
-            admin_mentions = []
-
-            for admin in admin_info:
-                if admin["type"] == "direct":
-                    admin_mentions.append(f"<@{admin['user_id']}>")
-                else:
-                    admin_mentions.append(f"@{admin['username']}")
-
-            message = f"""🚫 **Access Denied**
-
-**User:** @{username}
-**Operation:** `{operation}`
-**Reason:** {reason}
-
-**What you can do:**
-• Use `help` to see available commands for your role
-• Contact an administrator for elevated access
-• Try read-only operations like `list clusters` or `analyze performance`
-
-**Administrators:** {', '.join(admin_mentions[:5])}{'...' if len(admin_mentions) > 5 else ''}
-"""
+            # Get list of admins; only five are ever rendered below, so
+            # only resolve that many
+            admin_info = await self._require_rbac().get_admin_users_info(limit=5)
+            # admin_info is already capped at five entries, so no slice or
+            # ellipsis handling is needed here
+            admins = ", ".join(
+                f"<@{admin['user_id']}>" if admin["type"] == "direct" else f"@{admin['username']}"
+                for admin in admin_info
+            )
 
-            return message
+            return _DENIED_TEMPLATE.format_map(
+                {
+                    "username": username,
+                    "operation": operation,
+                    "reason": reason,
+                    "admins": admins,
+                }
+            )
 
         except Exception as e:
-            logger.error(f"Error handling permission denied: {e}")
+            logger.error("Error handling permission denied: %s", e)
             return f"❌ Access denied: {reason}. Contact an administrator for help."
 
     async def handle_rbac_command(self, user_id: str, operation: str) -> str:
@@ -344,17 +646,17 @@ Present the data in a way that's easy to understand for technical teams."""
         try:
             if operation == "rbac_report":
                 # Only admins can see full RBAC report
-                if not await self.rbac_manager.is_user_admin(user_id):
+                if not await self._is_user_admin_cached(user_id):
                     return "❌ Admin privileges required to view RBAC report"
 
-                return self.rbac_manager.generate_rbac_report()
+                return self._require_rbac().generate_rbac_report()
 
             elif operation == "list_admins":
                 # Only admins can see admin list
-                if not await self.rbac_manager.is_user_admin(user_id):
+                if not await self._is_user_admin_cached(user_id):
                     return "❌ Admin privileges required to view admin list"
 
-                admin_info = await self.rbac_manager.get_admin_users_info()
+                admin_info = await self._require_rbac().get_admin_users_info()
 
                 message = "👥 **Administrator List**\n\n"
 
@@ -379,49 +681,54 @@ Present the data in a way that's easy to understand for technical teams."""
                 return message
 
             elif operation == "check_permissions":
-                # Users can check their own permissions
-                permissions = self.rbac_manager.get_user_permissions(user_id)
-                is_admin = await self.rbac_manager.is_user_admin(user_id)
+                # Users can check their own permissions; the bullet lists are
+                # pre-sorted and pre-joined at config load time
+                formatted = self._require_rbac().get_user_permissions_formatted(user_id)
+                is_admin = await self._is_user_admin_cached(user_id)
 
-                message = "🔐 **Your Permissions**\n\n"
-                message += f"**Access Level:** {'Admin' if is_admin else 'User'}\n\n"
+                parts = ["🔐 **Your Permissions**\n"]
+                parts.append(f"**Access Level:** {'Admin' if is_admin else 'User'}\n")
 
                 if is_admin:
-                    message += "**Admin Operations Available:**\n"
-                    for op in sorted(permissions["admin_operations"]):
-                        message += f"• {op}\n"
-                    message += "\n"
+                    parts.append("**Admin Operations Available:**")
+                    parts.append(formatted["admin_operations"])
+                    parts.append("")
 
-                message += "**User Operations Available:**\n"
-                for op in sorted(permissions["allowed_operations"]):
-                    message += f"• {op}\n"
+                parts.append("**User Operations Available:**")
+                parts.append(formatted["allowed_operations"])
 
-                if permissions["self_service_operations"]:
-                    message += "\n**Self-Service Operations:**\n"
-                    for op in sorted(permissions["self_service_operations"]):
-                        message += f"• {op}\n"
+                if formatted["self_service_operations"]:
+                    parts.append("\n**Self-Service Operations:**")
+                    parts.append(formatted["self_service_operations"])
 
-                return message
+                return "\n".join(parts)
 
             else:
                 return "❌ Unknown RBAC command"
 
         except Exception as e:
-            logger.error(f"Error handling RBAC command: {e}")
+            logger.error("Error handling RBAC command: %s", e)
             return f"❌ Error processing RBAC command: {str(e)}"
 
     async def start(self):
         """Start the Slack bot"""
         try:
-            # Setup MCP connection
-            await self.setup_mcp_connection()
+            # Fail fast on missing configuration before any subprocess or
+            # network work happens
+            missing = self.config.missing_required()
+            if missing:
+                raise RuntimeError(f"Missing required environment variables: {', '.join(missing)}")
+
+            # The MCP connection is established lazily on first use, so the
+            # socket handler starts accepting Slack traffic immediately
+            # instead of waiting on the npx subprocess
 
             # Start socket mode handler
-            handler = AsyncSocketModeHandler(self.app, os.environ["SLACK_APP_TOKEN"])
+            handler = AsyncSocketModeHandler(self.app, self.config.slack_app_token)
             await handler.start_async()
 
         except Exception as e:
-            logger.error(f"Failed to start bot: {e}")
+            logger.error("Failed to start bot: %s", e)
             raise
 
 
@@ -4,8 +4,12 @@ Role-Based Access Control (RBAC) System for MongoDB Slack Bot
 Manages user permissions and access control for bot operations
 """
 
+import asyncio
+import importlib
 import logging
 import os
+import re
+import time
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
@@ -14,103 +18,259 @@ from slack_sdk.web.async_client import AsyncWebClient
 
 logger = logging.getLogger(__name__)
 
+# Slack user IDs start with U (or W for Enterprise Grid) and are at least
+# nine characters; newer workspaces issue IDs longer than the historical 11
+_SLACK_USER_ID_RE = re.compile(r"^[UW][A-Z0-9]{8,}$")
+
+# Operation sets used when neither the config module nor the environment
+# provides a value; built once instead of on every configuration load
+_DEFAULT_ADMIN_OPERATIONS = frozenset(
+    {
+        "create_cluster",
+        "create_user",
+        "reset_password",
+        "create_index",
+        "insert_document",
+        "update_document",
+        "delete_document",
+        "drop_collection",
+        "drop_database",
+        "manage_indexes",
+    }
+)
+
+_DEFAULT_USER_OPERATIONS = frozenset(
+    {
+        "list_clusters",
+        "list_databases",
+        "list_collections",
+        "schema_analysis",
+        "analyze_performance",
+        "slow_queries",
+        "missing_indexes",
+        "collection_stats",
+        "database_stats",
+        "help",
+    }
+)
+
+_DEFAULT_SELF_SERVICE_OPERATIONS = frozenset(
+    {
+        "reset_own_password",
+        "view_own_user_info",
+        "add_ip_whitelist",
+    }
+)
+
+# Minimal locked-down configuration applied when loading fails outright
+_FALLBACK_ADMIN_OPERATIONS = frozenset({"create_cluster", "create_user"})
+_FALLBACK_USER_OPERATIONS = frozenset({"list_clusters", "help"})
+_FALLBACK_SELF_SERVICE_OPERATIONS = frozenset({"reset_password", "add_ip_whitelist"})
+
 
 class RBACManager:
     """Manages role-based access control for the MongoDB Slack Bot"""
 
     def __init__(self, slack_client: AsyncWebClient):
         self.slack_client = slack_client
-        self.admin_users: set[str] = set()
-        self.admin_groups: set[str] = set()
-        self.admin_operations: set[str] = set()
-        self.user_operations: set[str] = set()
-        self.self_service_operations: set[str] = set()
+        self.admin_users: frozenset[str] = frozenset()
+        self.admin_groups: frozenset[str] = frozenset()
+        self.admin_operations: frozenset[str] = frozenset()
+        self.user_operations: frozenset[str] = frozenset()
+        self.self_service_operations: frozenset[str] = frozenset()
         self.rbac_enabled = True
         self.notify_admin_on_denied = True
         self.log_access_attempts = True
 
-        # Cache for group memberships to reduce API calls
-        self.group_membership_cache: dict[str, dict[str, Any]] = {}
+        # Usergroup caches shared across users: handle->id resolved from one
+        # usergroups_list call per TTL, and each group's member set fetched
+        # once and reused for every membership check
+        self._usergroup_handle_cache: dict[str, Any] = {"ts": 0.0, "map": {}}
+        self._usergroup_members_cache: dict[str, tuple[float, frozenset[str]]] = {}
+
+        # One refill lock per cache so concurrent permission checks hitting
+        # an expired cache trigger a single Slack fetch, not a stampede
+        self._user_dir_lock = asyncio.Lock()
+        self._usergroup_handle_lock = asyncio.Lock()
+        self._usergroup_members_lock = asyncio.Lock()
         self.username_to_id_cache: dict[str, dict[str, Any]] = (
             {}
         )  # Cache for username to ID mapping
         self.cache_ttl = 300  # 5 minutes
 
-        self.load_configuration()
-
-    def load_configuration(self):
-        """Load RBAC configuration from environment variables or config file"""
-        try:
-            # Try to import from config file first
-            try:
-                import config
+        # Usernames that failed to resolve, remembered briefly so repeated
+        # misses don't each trigger another round of Slack lookups
+        self._negative_lookup_cache: dict[str, float] = {}
+        self._negative_lookup_ttl = 60
+
+        # Strong references to fire-and-forget tasks; the event loop only
+        # keeps weak ones, so an unreferenced task can be garbage-collected
+        # before it runs
+        self._background_tasks: set = set()
+
+        # Workspace-wide user directory, fetched page by page and refreshed
+        # at most once per TTL; lookups against it are O(1) dict hits instead
+        # of a full users_list scan per unresolved admin entry
+        self._user_directory_cache: dict[str, Any] = {
+            "ts": 0.0,
+            "by_name": {},
+            "by_email": {},
+            "by_display": {},
+            "by_id": {},
+        }
 
-                self.rbac_enabled = getattr(config, "RBAC_ENABLED", True)
-                self.admin_users = set(getattr(config, "ADMIN_USERS", []))
-                self.admin_groups = set(getattr(config, "ADMIN_GROUPS", []))
-                self.admin_operations = set(getattr(config, "ADMIN_OPERATIONS", []))
-                self.user_operations = set(getattr(config, "USER_OPERATIONS", []))
-                self.self_service_operations = set(getattr(config, "SELF_SERVICE_OPERATIONS", []))
-                self.notify_admin_on_denied = getattr(config, "RBAC_NOTIFY_ADMIN_ON_DENIED", True)
-                self.log_access_attempts = getattr(config, "RBAC_LOG_ACCESS_ATTEMPTS", True)
+        # Memoized is_user_admin verdicts, keyed by user ID with the same TTL
+        # as the other directory caches
+        self._admin_decision_cache: dict[str, tuple[float, bool]] = {}
+
+        # Admin entries resolved to user IDs once per configuration, lazily on
+        # the first admin check since __init__ runs outside the event loop
+        self._resolved_admin_ids: set[str] = set()
+        self._admin_ids_resolved = False
+
+        # Admin entries split at config load into literal user IDs and names
+        # that still need Slack resolution, so the hot path never re-validates
+        self._admin_users_already_ids: set[str] = set()
+        self._admin_users_to_resolve: set[str] = set()
+
+        # Resolved admin info cached per limit value; the admin roster is
+        # long-lived, so denial and list_admins paths reuse it for 10 minutes
+        self._admin_info_cache: dict[Optional[int], dict[str, Any]] = {}
+        self._admin_info_ttl = 600
+
+        # Bullet-list renderings of the operation sets, rebuilt whenever the
+        # configuration changes; static between changes
+        self._permissions_formatted: Dict[str, str] = {}
+
+        # Rendered RBAC report cached against a hash of the configuration it
+        # was built from, aged out after a short TTL as a backstop for any
+        # mutation the hash wouldn't capture
+        self._rbac_report_cache: dict[int, tuple[float, str]] = {}
+        self._rbac_report_ttl = 60
+
+        # Flat operation -> category index built from the three operation
+        # sets, so the hot paths do one dict lookup instead of chained
+        # membership tests
+        self._operation_category: dict[str, str] = {}
+
+        # The optional config module, imported once on first use; the flag
+        # distinguishes "not imported yet" from "import failed"
+        self._config_module = None
+        self._config_module_loaded = False
 
-                logger.info("RBAC configuration loaded from config file")
+        self.load_configuration()
 
+    def _get_config_module(self):
+        """Import the optional config module once and reuse it thereafter"""
+        if not self._config_module_loaded:
+            try:
+                self._config_module = importlib.import_module("config")
             except ImportError:
-                # Fall back to environment variables
-                self.rbac_enabled = os.getenv("RBAC_ENABLED", "true").lower() == "true"
-                self.admin_users = set(
-                    os.getenv("ADMIN_USERS", "").split(",") if os.getenv("ADMIN_USERS") else []
-                )
-                self.admin_groups = set(
-                    os.getenv("ADMIN_GROUPS", "").split(",") if os.getenv("ADMIN_GROUPS") else []
-                )
-
-                # Default admin operations
-                self.admin_operations = {
-                    "create_cluster",
-                    "create_user",
-                    "reset_password",
-                    "create_index",
-                    "insert_document",
-                    "update_document",
-                    "delete_document",
-                    "drop_collection",
-                    "drop_database",
-                    "manage_indexes",
-                }
+                self._config_module = None
+            self._config_module_loaded = True
+        return self._config_module
+
+    def _config_value(self, key: str):
+        """A setting from the config module, or None when absent"""
+        module = self._get_config_module()
+        return getattr(module, key, None) if module is not None else None
+
+    def _bool_setting(self, key: str, default: bool) -> bool:
+        """Resolve a boolean setting: config module, then env var, then default"""
+        value = self._config_value(key)
+        if value is not None:
+            return bool(value)
+        env_value = os.getenv(key)
+        if env_value is not None:
+            return env_value.lower() == "true"
+        return default
+
+    def _set_setting(self, key: str, default: frozenset[str]) -> frozenset[str]:
+        """Resolve a set-valued setting: config module, then env var, then default"""
+        value = self._config_value(key)
+        if value is not None:
+            return frozenset(value)
+        env_value = os.getenv(key)
+        if env_value:
+            return frozenset(env_value.split(","))
+        return default
 
-                # Default user operations
-                self.user_operations = {
-                    "list_clusters",
-                    "list_databases",
-                    "list_collections",
-                    "schema_analysis",
-                    "analyze_performance",
-                    "slow_queries",
-                    "missing_indexes",
-                    "collection_stats",
-                    "database_stats",
-                    "help",
-                }
+    def load_configuration(self):
+        """Load RBAC configuration from the config module and environment.
 
-                self.self_service_operations = {
-                    "reset_own_password",
-                    "view_own_user_info",
-                    "add_ip_whitelist",
-                }
+        Each setting is resolved independently — config module value first,
+        then environment variable, then default — so a config file that only
+        defines some keys no longer silently discards env-based overrides
+        for the rest.
+        """
+        try:
+            self.rbac_enabled = self._bool_setting("RBAC_ENABLED", True)
+            self.admin_users = self._set_setting("ADMIN_USERS", frozenset())
+            self.admin_groups = self._set_setting("ADMIN_GROUPS", frozenset())
+            self.admin_operations = self._set_setting(
+                "ADMIN_OPERATIONS", _DEFAULT_ADMIN_OPERATIONS
+            )
+            self.user_operations = self._set_setting("USER_OPERATIONS", _DEFAULT_USER_OPERATIONS)
+            self.self_service_operations = self._set_setting(
+                "SELF_SERVICE_OPERATIONS", _DEFAULT_SELF_SERVICE_OPERATIONS
+            )
+            self.notify_admin_on_denied = self._bool_setting("RBAC_NOTIFY_ADMIN_ON_DENIED", True)
+            self.log_access_attempts = self._bool_setting("RBAC_LOG_ACCESS_ATTEMPTS", True)
 
-                logger.info("RBAC configuration loaded from environment variables")
+            source = "config file" if self._get_config_module() else "environment variables"
+            logger.info(f"RBAC configuration loaded from {source}")
 
         except Exception as e:
             logger.error(f"Error loading RBAC configuration: {e}")
             # Default to secure configuration
             self.rbac_enabled = True
-            self.admin_users = set()
-            self.admin_groups = set()
-            self.admin_operations = {"create_cluster", "create_user"}
-            self.user_operations = {"list_clusters", "help"}
-            self.self_service_operations = {"reset_password", "add_ip_whitelist"}
+            self.admin_users = frozenset()
+            self.admin_groups = frozenset()
+            self.admin_operations = _FALLBACK_ADMIN_OPERATIONS
+            self.user_operations = _FALLBACK_USER_OPERATIONS
+            self.self_service_operations = _FALLBACK_SELF_SERVICE_OPERATIONS
+
+        self._classify_admin_entries()
+        self._rebuild_operation_index()
+        self._rebuild_formatted_permissions()
+
+    def _classify_admin_entries(self):
+        """Split admin entries into literal user IDs and names to resolve"""
+        self._admin_users_already_ids = {
+            entry for entry in self.admin_users if _SLACK_USER_ID_RE.match(entry)
+        }
+        self._admin_users_to_resolve = self.admin_users - self._admin_users_already_ids
+
+    def _rebuild_operation_index(self):
+        """Flatten the operation sets into one operation -> category dict.
+
+        Later entries win, so an operation listed in several sets keeps the
+        same precedence the old chained membership tests gave it: admin over
+        user over self_service.
+        """
+        self._operation_category = (
+            {op: "self_service" for op in self.self_service_operations}
+            | {op: "user" for op in self.user_operations}
+            | {op: "admin" for op in self.admin_operations}
+        )
+
+    def _rebuild_formatted_permissions(self):
+        """Pre-sort the operation sets and cache their bullet-list strings"""
+        self._permissions_formatted = {
+            "admin_operations": "\n".join(f"• {op}" for op in sorted(self.admin_operations)),
+            "allowed_operations": "\n".join(f"• {op}" for op in sorted(self.user_operations)),
+            "self_service_operations": "\n".join(
+                f"• {op}" for op in sorted(self.self_service_operations)
+            ),
+        }
+
+    def _spawn_background_task(self, coro) -> asyncio.Task:
+        """Schedule a fire-and-forget coroutine, keeping a strong reference
+        in _background_tasks until it completes"""
+        task = asyncio.create_task(coro)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+        return task
 
     async def check_user_permission(
         self, user_id: str, operation: str, target_user: Optional[str] = None
@@ -133,52 +293,105 @@ class RBACManager:
         if self.log_access_attempts:
             logger.info(f"Permission check: User {user_id} attempting {operation}")
 
+        category = self._operation_category.get(operation)
+
         # Check if it's a self-service operation
         if operation in self.self_service_operations and target_user == user_id:
             return {"allowed": True, "reason": "Self-service operation"}
 
-        # Check if user is admin
-        is_admin = await self.is_user_admin(user_id)
+        # Operations open to everyone never need the admin lookup, which can
+        # hit the Slack API on a cold cache
+        if category == "user":
+            return {"allowed": True, "reason": "User operation"}
 
-        if is_admin:
+        # Admins may run self-service operations on another user's behalf
+        if category == "self_service" and await self.is_user_admin(user_id):
             return {"allowed": True, "reason": "Admin user"}
 
-        # Check if operation is allowed for regular users
-        if operation in self.user_operations:
-            return {"allowed": True, "reason": "User operation"}
+        # Only admin operations warrant resolving admin status
+        if category == "admin":
+            if await self.is_user_admin(user_id):
+                return {"allowed": True, "reason": "Admin user"}
 
-        # Check if operation requires admin privileges
-        if operation in self.admin_operations:
             reason = "Admin privileges required"
             if self.notify_admin_on_denied:
-                await self.notify_admin_of_denied_access(user_id, operation)
+                # Fire-and-forget: the user should not wait on admin DMs
+                # before seeing their denial
+                self._spawn_background_task(
+                    self.notify_admin_of_denied_access(user_id, operation)
+                )
             return {"allowed": False, "reason": reason}
 
-        # Default deny for unknown operations
+        # Operations absent from every set keep the baseline behaviour:
+        # admins may run anything, everyone else is denied
+        if await self.is_user_admin(user_id):
+            return {"allowed": True, "reason": "Admin user"}
         return {"allowed": False, "reason": "Unknown operation"}
 
     async def is_user_admin(self, user_id: str) -> bool:
         """Check if a user is an admin"""
+        # Serve repeated checks for the same user from the decision cache;
+        # a cold check can cost several Slack API calls
+        cached = self._admin_decision_cache.get(user_id)
+        now = time.monotonic()
+        if cached and now - cached[0] < self.cache_ttl:
+            return cached[1]
+
+        is_admin = await self._compute_is_user_admin(user_id)
+        self._admin_decision_cache[user_id] = (now, is_admin)
+        return is_admin
+
+    async def _compute_is_user_admin(self, user_id: str) -> bool:
+        """Resolve admin status without consulting the decision cache"""
         # Check direct admin user list (supports both IDs and usernames)
         if user_id in self.admin_users:
             return True
 
-        # Check if any admin user entry matches this user (by username)
-        for admin_entry in self.admin_users:
-            if await self.resolve_admin_entry_to_user_id(admin_entry) == user_id:
-                return True
+        # Check against the admin entries resolved once per configuration
+        if not self._admin_ids_resolved:
+            await self._resolve_admin_entries()
+        if user_id in self._resolved_admin_ids:
+            return True
 
-        # Check admin groups
-        for group in self.admin_groups:
-            if await self.is_user_in_group(user_id, group):
-                return True
+        # Check admin groups concurrently; one group API failure is logged
+        # and treated as non-membership rather than failing the whole check
+        if self.admin_groups:
+            groups = tuple(self.admin_groups)
+            results = await asyncio.gather(
+                *(self.is_user_in_group(user_id, group) for group in groups),
+                return_exceptions=True,
+            )
+            for group, result in zip(groups, results):
+                if isinstance(result, Exception):
+                    logger.error(f"Error checking admin group {group}: {result}")
+                elif result:
+                    return True
 
         return False
 
+    async def _resolve_admin_entries(self):
+        """Resolve every non-ID admin entry to a user ID in one parallel pass"""
+        entries = tuple(self._admin_users_to_resolve)
+        resolved = await asyncio.gather(
+            *(self.resolve_admin_entry_to_user_id(entry) for entry in entries),
+            return_exceptions=True,
+        )
+
+        resolved_ids: set[str] = set()
+        for entry, user_id in zip(entries, resolved):
+            if isinstance(user_id, Exception):
+                logger.error(f"Error resolving admin entry {entry}: {user_id}")
+            elif user_id:
+                resolved_ids.add(user_id)
+
+        self._resolved_admin_ids = resolved_ids
+        self._admin_ids_resolved = True
+
     async def resolve_admin_entry_to_user_id(self, admin_entry: str) -> Optional[str]:
         """Resolve an admin entry (username or ID) to a user ID"""
-        # If it's already a user ID format, return as-is
-        if admin_entry.startswith("U") and len(admin_entry) == 11:
+        # If it's already a user ID format, return as-is; configured entries
+        # were classified at load time, anything else hits the compiled regex
+        if admin_entry in self._admin_users_already_ids or _SLACK_USER_ID_RE.match(admin_entry):
             return admin_entry
 
         # Clean up the username
@@ -188,7 +401,7 @@ class RBACManager:
         cache_key = f"username:{username}"
         if cache_key in self.username_to_id_cache:
             cached_data = self.username_to_id_cache[cache_key]
-            if datetime.now().timestamp() - cached_data["timestamp"] < self.cache_ttl:
+            if time.monotonic() - cached_data["timestamp"] < self.cache_ttl:
                 return cached_data["user_id"]
 
         # Resolve username to user ID
@@ -198,33 +411,95 @@ class RBACManager:
         if user_id:
             self.username_to_id_cache[cache_key] = {
                 "user_id": user_id,
-                "timestamp": datetime.now().timestamp(),
+                "timestamp": time.monotonic(),
             }
 
         return user_id
 
+    async def _get_user_directory(self) -> dict[str, Any]:
+        """Return the cached workspace user directory, refreshing it on TTL expiry.
+
+        The refresh pages through users_list with a cursor instead of pulling
+        the whole workspace in one unbounded call, and indexes every member by
+        username, lowercased real name, display name, and email in a single
+        pass so later lookups never rescan the member list.
+        """
+        cache = self._user_directory_cache
+        if time.monotonic() - cache["ts"] < self.cache_ttl:
+            return cache
+
+        async with self._user_dir_lock:
+            # Double-checked: another task may have refreshed while we waited
+            now = time.monotonic()
+            if now - cache["ts"] < self.cache_ttl:
+                return cache
+            return await self._refresh_user_directory(now)
+
+    async def _refresh_user_directory(self, now: float) -> dict[str, Any]:
+        """Rebuild the user directory; callers must hold _user_dir_lock"""
+        cache = self._user_directory_cache
+        by_name: dict[str, str] = {}
+        by_email: dict[str, str] = {}
+        by_display: dict[str, str] = {}
+        by_id: dict[str, dict[str, str]] = {}
+
+        cursor = None
+        while True:
+            response = await self.slack_client.users_list(limit=200, cursor=cursor)
+            if not response["ok"]:
+                break
+
+            for user in response["members"]:
+                if user.get("deleted", False):
+                    continue
+                user_id = user["id"]
+                profile = user.get("profile", {})
+                if user.get("name"):
+                    by_name.setdefault(user["name"], user_id)
+                for real_name in (user.get("real_name"), profile.get("real_name")):
+                    if real_name:
+                        by_name.setdefault(real_name.lower(), user_id)
+                for display_name in (user.get("display_name"), profile.get("display_name")):
+                    if display_name:
+                        by_display.setdefault(display_name, user_id)
+                if profile.get("email"):
+                    by_email.setdefault(profile["email"].lower(), user_id)
+                by_id[user_id] = {
+                    "username": user.get("name", ""),
+                    "real_name": user.get("real_name", ""),
+                }
+
+            cursor = (response.get("response_metadata") or {}).get("next_cursor")
+            if not cursor:
+                break
+
+        cache.update(
+            ts=now, by_name=by_name, by_email=by_email, by_display=by_display, by_id=by_id
+        )
+        return cache
+
+    @staticmethod
+    def _looks_like_email(username: str) -> bool:
+        return "@" in username and "." in username.split("@")[-1]
+
     async def resolve_username_to_user_id(self, username: str) -> Optional[str]:
         """Resolve a username to a Slack user ID"""
+        # Skip names that recently failed to resolve rather than re-querying
+        # Slack for every message that mentions them
+        negative_ts = self._negative_lookup_cache.get(username)
+        if negative_ts is not None and time.monotonic() - negative_ts < self._negative_lookup_ttl:
+            return None
+
         try:
-            # Try to find user by username
-            response = await self.slack_client.users_list()
-
-            if response["ok"]:
-                for user in response["members"]:
-                    if not user.get("deleted", False):
-                        # Check various username formats
-                        if (
-                            user.get("name") == username
-                            or user.get("real_name", "").lower() == username.lower()
-                            or user.get("display_name") == username
-                            or user.get("profile", {}).get("display_name") == username
-                            or user.get("profile", {}).get("real_name", "").lower()
-                            == username.lower()
-                        ):
-                            return user["id"]
-
-            # If not found in users list, try users.lookupByEmail if it looks like an email
-            if "@" in username:
+            # Emails go straight to the targeted lookupByEmail call instead
+            # of forcing a full directory refresh; the cached directory is
+            # consulted first only when it is already warm
+            if self._looks_like_email(username):
+                directory = self._user_directory_cache
+                if time.monotonic() - directory["ts"] < self.cache_ttl:
+                    user_id = directory["by_email"].get(username.lower())
+                    if user_id:
+                        return user_id
                 try:
                     email_response = await self.slack_client.users_lookupByEmail(email=username)
                     if email_response["ok"]:
@@ -232,43 +507,74 @@ class RBACManager:
                 except SlackApiError:
                     pass
 
+            # Ambiguous display names fall back to the paginated directory,
+            # checking the same username formats the old linear scan covered
+            directory = await self._get_user_directory()
+            user_id = (
+                directory["by_name"].get(username)
+                or directory["by_name"].get(username.lower())
+                or directory["by_display"].get(username)
+            )
+            if user_id:
+                return user_id
+
         except SlackApiError as e:
+            # Transient API failures are not cached as misses
             logger.error(f"Error resolving username {username}: {e}")
+            return None
 
+        self._negative_lookup_cache[username] = time.monotonic()
         return None
 
-    async def is_user_in_group(self, user_id: str, group_name: str) -> bool:
-        """Check if a user is in a specific group"""
-        cache_key = f"{user_id}:{group_name}"
+    async def _get_usergroup_id(self, group_name: str) -> Optional[str]:
+        """Translate a usergroup handle to its ID via the cached handle map"""
+        cache = self._usergroup_handle_cache
+        if time.monotonic() - cache["ts"] >= self.cache_ttl:
+            async with self._usergroup_handle_lock:
+                if time.monotonic() - cache["ts"] >= self.cache_ttl:
+                    response = await self.slack_client.usergroups_list()
+                    if response["ok"]:
+                        cache["map"] = {
+                            usergroup["handle"]: usergroup["id"]
+                            for usergroup in response["usergroups"]
+                        }
+                        cache["ts"] = time.monotonic()
 
-        # Check cache
-        if cache_key in self.group_membership_cache:
-            cached_data = self.group_membership_cache[cache_key]
-            if datetime.now().timestamp() - cached_data["timestamp"] < self.cache_ttl:
-                return cached_data["is_member"]
+        return cache["map"].get(group_name)
 
-        try:
-            # Get user groups from Slack API
-            response = await self.slack_client.usergroups_list()
+    async def _get_usergroup_members(self, usergroup_id: str) -> frozenset[str]:
+        """Return the cached member set for a usergroup, refreshing on expiry"""
+        cached = self._usergroup_members_cache.get(usergroup_id)
+        if cached and time.monotonic() - cached[0] < self.cache_ttl:
+            return cached[1]
 
-            if response["ok"]:
-                for usergroup in response["usergroups"]:
-                    if usergroup["handle"] == group_name:
-                        # Get usergroup members
-                        members_response = await self.slack_client.usergroups_users_list(
-                            usergroup=usergroup["id"]
-                        )
+        async with self._usergroup_members_lock:
+            cached = self._usergroup_members_cache.get(usergroup_id)
+            now = time.monotonic()
+            if cached and now - cached[0] < self.cache_ttl:
+                return cached[1]
 
-                        if members_response["ok"]:
-                            is_member = user_id in members_response["users"]
+            members_response = await self.slack_client.usergroups_users_list(
+                usergroup=usergroup_id
+            )
+            if not members_response["ok"]:
+                return frozenset()
 
-                            # Cache the result
-                            self.group_membership_cache[cache_key] = {
-                                "is_member": is_member,
-                                "timestamp": datetime.now().timestamp(),
-                            }
+            # Hash-based membership instead of scanning the raw member list,
+            # which Slack returns as a plain list that can run to thousands
+            members = frozenset(members_response["users"])
+            self._usergroup_members_cache[usergroup_id] = (now, members)
+            return members
 
-                            return is_member
+    async def is_user_in_group(self, user_id: str, group_name: str) -> bool:
+        """Check if a user is in a specific group"""
+        try:
+            usergroup_id = await self._get_usergroup_id(group_name)
+            if usergroup_id is None:
+                return False
+
+            members = await self._get_usergroup_members(usergroup_id)
+            return user_id in members
 
         except SlackApiError as e:
             logger.error(f"Error checking group membership: {e}")
@@ -290,12 +596,19 @@ class RBACManager:
                 f"This user attempted to perform an admin-only operation."
             )
 
-            # Send notification to admin users
-            for admin_user in self.admin_users:
-                try:
-                    await self.slack_client.chat_postMessage(channel=admin_user, text=message)
-                except SlackApiError as e:
-                    logger.error(f"Error notifying admin {admin_user}: {e}")
+            # Post to all admins in parallel; a failed DM is logged without
+            # blocking the others
+            admins = tuple(self.admin_users)
+            results = await asyncio.gather(
+                *(
+                    self.slack_client.chat_postMessage(channel=admin_user, text=message)
+                    for admin_user in admins
+                ),
+                return_exceptions=True,
+            )
+            for admin_user, result in zip(admins, results):
+                if isinstance(result, Exception):
+                    logger.error(f"Error notifying admin {admin_user}: {result}")
 
         except Exception as e:
             logger.error(f"Error in admin notification: {e}")
@@ -310,38 +623,75 @@ class RBACManager:
 
         return permissions
 
+    def get_user_permissions_formatted(self, user_id: str) -> Dict[str, str]:
+        """Get the user-facing bullet-list strings for each operation set"""
+        return self._permissions_formatted
+
     def get_operation_category(self, operation: str) -> str:
         """Get the category of an operation"""
-        if operation in self.admin_operations:
-            return "admin"
-        elif operation in self.user_operations:
-            return "user"
-        elif operation in self.self_service_operations:
-            return "self_service"
-        else:
-            return "unknown"
-
-    async def get_admin_users_info(self) -> List[Dict[str, str]]:
-        """Get information about admin users"""
+        return self._operation_category.get(operation, "unknown")
+
+    async def get_admin_users_info(self, limit: Optional[int] = None) -> List[Dict[str, str]]:
+        """Get information about admin users.
+
+        The per-admin users.info lookups are issued concurrently, so the
+        total latency is one Slack round-trip rather than one per admin.
+        When limit is given only that many entries are resolved, sparing
+        lookups for admins a caller would never render.
+        """
+        cached = self._admin_info_cache.get(limit)
+        if cached and time.monotonic() - cached["timestamp"] < self._admin_info_ttl:
+            return cached["admin_info"]
+
         admin_info = []
 
-        for user_id in self.admin_users:
-            try:
-                user_info = await self.slack_client.users_info(user=user_id)
-                if user_info["ok"]:
-                    admin_info.append(
-                        {
-                            "user_id": user_id,
-                            "username": user_info["user"]["name"],
-                            "real_name": user_info["user"]["real_name"],
-                            "type": "direct",
-                        }
-                    )
-            except SlackApiError as e:
-                logger.error(f"Error getting admin user info for {user_id}: {e}")
+        user_ids = list(self.admin_users)
+        if limit is not None:
+            user_ids = user_ids[:limit]
+
+        # Serve admins from the warm workspace directory first; only IDs it
+        # doesn't know about cost a users_info call
+        directory = self._user_directory_cache
+        directory_warm = time.monotonic() - directory["ts"] < self.cache_ttl
+        remaining_ids = []
+        for user_id in user_ids:
+            entry = directory["by_id"].get(user_id) if directory_warm else None
+            if entry:
+                admin_info.append(
+                    {
+                        "user_id": user_id,
+                        "username": entry["username"],
+                        "real_name": entry["real_name"],
+                        "type": "direct",
+                    }
+                )
+            else:
+                remaining_ids.append(user_id)
+
+        responses = await asyncio.gather(
+            *(self.slack_client.users_info(user=user_id) for user_id in remaining_ids),
+            return_exceptions=True,
+        )
+        for user_id, user_info in zip(remaining_ids, responses):
+            # BaseException, not Exception: gather types its results as
+            # response | BaseException, so this is what narrows for mypy
+            if isinstance(user_info, BaseException):
+                logger.error(f"Error getting admin user info for {user_id}: {user_info}")
+                continue
+            if user_info["ok"]:
+                admin_info.append(
+                    {
+                        "user_id": user_id,
+                        "username": user_info["user"]["name"],
+                        "real_name": user_info["user"]["real_name"],
+                        "type": "direct",
+                    }
+                )
 
         # Add group-based admins
         for group in self.admin_groups:
+            if limit is not None and len(admin_info) >= limit:
+                break
             admin_info.append(
                 {
                     "user_id": f"@{group}",
@@ -351,56 +701,128 @@ class RBACManager:
                 }
             )
 
+        self._admin_info_cache[limit] = {
+            "admin_info": admin_info,
+            "timestamp": time.monotonic(),
+        }
         return admin_info
 
+    def invalidate(self):
+        """Drop cached admin info after configuration or membership changes"""
+        self._admin_info_cache.clear()
+
+    def _report_config_key(self) -> int:
+        """Hash of every configuration field rendered in the RBAC report"""
+        return hash(
+            (
+                self.rbac_enabled,
+                frozenset(self.admin_users),
+                frozenset(self.admin_groups),
+                self.admin_operations,
+                self.user_operations,
+                self.self_service_operations,
+                self.notify_admin_on_denied,
+                self.log_access_attempts,
+            )
+        )
+
     def generate_rbac_report(self) -> str:
         """Generate a report of RBAC configuration"""
-        report = f"""
-🔐 **RBAC Configuration Report**
-
-**Status:** {'Enabled' if self.rbac_enabled else 'Disabled'}
-
-**Admin Users:** {len(self.admin_users)}
-{chr(10).join(f"• {user}" for user in self.admin_users)}
-
-**Admin Groups:** {len(self.admin_groups)}
-{chr(10).join(f"• {group}" for group in self.admin_groups)}
-
-**Admin Operations:** {len(self.admin_operations)}
-{chr(10).join(f"• {op}" for op in sorted(self.admin_operations))}
-
-**User Operations:** {len(self.user_operations)}
-{chr(10).join(f"• {op}" for op in sorted(self.user_operations))}
-
-**Self-Service Operations:** {len(self.self_service_operations)}
-{chr(10).join(f"• {op}" for op in sorted(self.self_service_operations))}
-
-**Notifications:** {'Enabled' if self.notify_admin_on_denied else 'Disabled'}
-**Access Logging:** {'Enabled' if self.log_access_attempts else 'Disabled'}
+        config_key = self._report_config_key()
+        cached = self._rbac_report_cache.get(config_key)
+        if cached is not None and time.monotonic() - cached[0] < self._rbac_report_ttl:
+            return cached[1]
+
+        admin_ops = sorted(self.admin_operations)
+        user_ops = sorted(self.user_operations)
+        self_service_ops = sorted(self.self_service_operations)
+
+        lines = [
+            "🔐 **RBAC Configuration Report**",
+            "",
+            f"**Status:** {'Enabled' if self.rbac_enabled else 'Disabled'}",
+            "",
+            f"**Admin Users:** {len(self.admin_users)}",
+            "\n".join(f"• {user}" for user in self.admin_users),
+            "",
+            f"**Admin Groups:** {len(self.admin_groups)}",
+            "\n".join(f"• {group}" for group in self.admin_groups),
+            "",
+            f"**Admin Operations:** {len(admin_ops)}",
+            "\n".join(f"• {op}" for op in admin_ops),
+            "",
+            f"**User Operations:** {len(user_ops)}",
+            "\n".join(f"• {op}" for op in user_ops),
+            "",
+            f"**Self-Service Operations:** {len(self_service_ops)}",
+            "\n".join(f"• {op}" for op in self_service_ops),
+            "",
+            f"**Notifications:** {'Enabled' if self.notify_admin_on_denied else 'Disabled'}",
+            f"**Access Logging:** {'Enabled' if self.log_access_attempts else 'Disabled'}",
+        ]
+
+        report = "\n".join(lines)
+        # Keep only the report for the live configuration
+        self._rbac_report_cache = {config_key: (time.monotonic(), report)}
+        return report
+
+    async def prime_caches(self):
+        """Warm every directory cache so first permission checks stay local.
+
+        Concurrently refreshes the workspace user directory, resolves the
+        configured admin entries to user IDs, and fetches the member sets of
+        all admin groups. Meant to be scheduled once at startup; any failure
+        is logged and the affected cache simply fills lazily later.
         """
 
-        return report.strip()
+        async def _warm_admin_groups():
+            for group in self.admin_groups:
+                usergroup_id = await self._get_usergroup_id(group)
+                if usergroup_id:
+                    await self._get_usergroup_members(usergroup_id)
+
+        results = await asyncio.gather(
+            self._get_user_directory(),
+            self._resolve_admin_entries(),
+            _warm_admin_groups(),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error(f"Error priming RBAC caches: {result}")
 
     async def clear_cache(self):
-        """Clear the group membership cache"""
-        self.group_membership_cache.clear()
+        """Clear the group membership caches"""
+        self._usergroup_handle_cache["ts"] = 0.0
+        self._usergroup_members_cache.clear()
+        self._admin_decision_cache.clear()
+        self._negative_lookup_cache.clear()
+        self._admin_ids_resolved = False
+        self.invalidate()
         logger.info("RBAC cache cleared")
 
     def update_configuration(self, config_updates: Dict[str, Any]):
         """Update RBAC configuration at runtime"""
         for key, value in config_updates.items():
             if key == "admin_users":
-                self.admin_users = set(value)
+                self.admin_users = frozenset(value)
             elif key == "admin_groups":
-                self.admin_groups = set(value)
+                self.admin_groups = frozenset(value)
             elif key == "admin_operations":
-                self.admin_operations = set(value)
+                self.admin_operations = frozenset(value)
             elif key == "user_operations":
-                self.user_operations = set(value)
+                self.user_operations = frozenset(value)
             elif key == "rbac_enabled":
                 self.rbac_enabled = value
 
+        self._classify_admin_entries()
+        self._rebuild_operation_index()
+        self._rebuild_formatted_permissions()
         logger.info(f"RBAC configuration updated: {config_updates}")
 
-        # Clear cache after configuration change
-        self.group_membership_cache.clear()
+        # Clear caches after configuration change
+        self._usergroup_handle_cache["ts"] = 0.0
+        self._usergroup_members_cache.clear()
+        self._admin_decision_cache.clear()
+        self._admin_ids_resolved = False
+        self.invalidate()
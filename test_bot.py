@@ -4,244 +4,302 @@ Test script for MongoDB Slack Bot
 Tests basic functionality without requiring Slack or full MCP setup
 """
 
-import asyncio
+import importlib.util
 import os
 import sys
-from unittest.mock import MagicMock
+from types import SimpleNamespace
+from unittest.mock import patch
 
 # Add the current directory to the path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from command_handler import MongoCommandHandler
 
-
-async def test_command_categorization():
+# RBAC test configuration, built once at import. SimpleNamespace attribute
+# access goes through the C getattr slot, and patch.dict below guarantees the
+# sys.modules entry is removed again after the test.
+_FAKE_CONFIG = SimpleNamespace(
+    RBAC_ENABLED=True,
+    ADMIN_USERS=[],
+    ADMIN_GROUPS=[],
+    ADMIN_OPERATIONS=["create_cluster", "reset_password"],
+    USER_OPERATIONS=["list_clusters"],
+    SELF_SERVICE_OPERATIONS=["reset_own_password", "add_ip_whitelist"],
+    RBAC_NOTIFY_ADMIN_ON_DENIED=True,
+    RBAC_LOG_ACCESS_ATTEMPTS=True,
+)
+
+# One stub session and handler shared by every test. categorize_command
+# never touches the session, so a bare SimpleNamespace avoids MagicMock's
+# per-attribute child-mock machinery; sharing the handler lets its
+# categorization cache carry across the categorization and extraction tests
+_SESSION = SimpleNamespace()
+_HANDLER = MongoCommandHandler(_SESSION)
+
+# Test-case tables as module-level tuples: materialized once at import
+# instead of rebuilt as lists on every test invocation, and ready for
+# pytest parametrization
+_CATEGORIZATION_CASES = (
+    ("List my clusters", "atlas_management"),
+    ("Create a new cluster called test-cluster", "atlas_management"),
+    ("Add IP 192.168.1.100 to whitelist", "security"),
+    ("Analyze cluster performance over last 24 hours", "performance"),
+    ("Show slow queries on cluster prod", "performance"),
+    ("List all databases in cluster production", "database"),
+    ("Find missing indexes in ecommerce on cluster staging", "optimization"),
+    ("Find missing indexes on cluster staging", "optimization"),
+    ("Find redundant indexes in database products on cluster dev", "optimization"),
+    ("Show redundant indexes on cluster dev", "optimization"),
+    ("Show duplicate indexes in cluster analytics", "optimization"),
+    ("Reset password for user admin", "security"),
+    ("Show collections in database users on cluster production", "database"),
+    ("Analyze schema for collection products in cluster staging", "database"),
+    ("Show RBAC report", "rbac"),
+    ("List admins", "rbac"),
+    ("What can I do", "rbac"),
+    ("help", "general"),
+)
+
+_CLUSTER_CASES = (
+    ("Analyze cluster prod-db performance", "prod-db"),
+    ("Show details for cluster testing", "testing"),
+    ("Performance issues on staging", "staging"),
+    ("Create cluster called new-cluster", "new-cluster"),
+)
+
+_IP_CASES = (
+    ("Add IP 192.168.1.100 to whitelist", "192.168.1.100"),
+    ("Whitelist 10.0.0.1 for development", "10.0.0.1"),
+    ("Allow access from 172.16.0.50", "172.16.0.50"),
+)
+
+_DB_CASES = (
+    ("Find missing indexes in database products on cluster production", "products"),
+    ("Find missing indexes on cluster production", None),
+    ("Show redundant indexes in database ecommerce on cluster staging", "ecommerce"),
+    ("Show redundant indexes on cluster staging", None),
+)
+
+_HELP_SECTIONS = (
+    "Atlas Management",
+    "Performance Analysis",
+    "Database Operations",
+    "Security",
+    "Optimization",
+)
+
+_OPERATION_CATEGORY_CASES = (
+    ("create_cluster", "admin"),
+    ("list_clusters", "user"),
+    ("reset_own_password", "self_service"),
+    ("add_ip_whitelist", "self_service"),
+    ("reset_password", "admin"),
+    ("unknown_operation", "unknown"),
+)
+
+_USERNAME_CASES = (
+    ("U1234567890", "U1234567890"),  # Already a user ID
+    ("@david.murphy", "david.murphy"),  # Username with @
+    ("jane.smith", "jane.smith"),  # Username without @
+)
+
+
+def test_command_categorization():
     """Test command categorization without MCP connection"""
     print("🧪 Testing command categorization...")
 
-    # Mock MCP session
-    mock_session = MagicMock()
-    handler = MongoCommandHandler(mock_session)
-
-    # Test cases
-    test_commands = [
-        ("List my clusters", "atlas_management"),
-        ("Create a new cluster called test-cluster", "atlas_management"),
-        ("Add IP 192.168.1.100 to whitelist", "security"),
-        ("Analyze cluster performance over last 24 hours", "performance"),
-        ("Show slow queries on cluster prod", "performance"),
-        ("List all databases in cluster production", "database"),
-        ("Find missing indexes in ecommerce on cluster staging", "optimization"),
-        ("Find missing indexes on cluster staging", "optimization"),
-        ("Find redundant indexes in database products on cluster dev", "optimization"),
-        ("Show redundant indexes on cluster dev", "optimization"),
-        ("Show duplicate indexes in cluster analytics", "optimization"),
-        ("Reset password for user admin", "security"),
-        ("Show collections in database users on cluster production", "database"),
-        ("Analyze schema for collection products in cluster staging", "database"),
-        ("Show RBAC report", "rbac"),
-        ("List admins", "rbac"),
-        ("What can I do", "rbac"),
-        ("help", "general"),
-    ]
-
-    results = []
-    for command, expected_category in test_commands:
-        result = handler.categorize_command(command)
-        category = result["category"]
-        action = result["action"]
+    handler = _HANDLER
 
-        status = "✅" if category == expected_category else "❌"
-        print(f"{status} '{command}' -> {category}/{action}")
-        results.append(category == expected_category)
+    # Compute everything first, then emit one write instead of interleaving
+    # stdout I/O with the categorization loop
+    results = [
+        (command, expected, handler.categorize_command(command))
+        for command, expected in _CATEGORIZATION_CASES
+    ]
+    lines = [
+        f"{'✅' if info.category == expected else '❌'} '{command}' -> {info.category}/{info.action}"
+        for command, expected, info in results
+    ]
+    sys.stdout.write("\n".join(lines) + "\n")
 
-    success_rate = sum(results) / len(results) * 100
+    success_rate = sum(info.category == expected for _, expected, info in results) / len(
+        results
+    ) * 100
     print(f"\n📊 Success rate: {success_rate:.1f}%")
 
-    return success_rate > 80
+    # Real assertion so running this file under pytest fails on regression
+    # instead of only printing ❌
+    assert success_rate > 80, f"Categorization success rate {success_rate:.1f}% below threshold"
 
 
-async def test_parameter_extraction():
+def test_parameter_extraction():
     """Test parameter extraction from commands"""
     print("\n🔍 Testing parameter extraction...")
 
-    mock_session = MagicMock()
-    handler = MongoCommandHandler(mock_session)
+    handler = _HANDLER
 
     # Test cluster name extraction
-    cluster_tests = [
-        ("Analyze cluster prod-db performance", "prod-db"),
-        ("Show details for cluster testing", "testing"),
-        ("Performance issues on staging", "staging"),
-        ("Create cluster called new-cluster", "new-cluster"),
-    ]
 
-    for command, expected_cluster in cluster_tests:
-        result = handler.categorize_command(command)
-        extracted = result.get("cluster_name")
-        status = "✅" if extracted == expected_cluster else "❌"
-        print(f"{status} Cluster from '{command}' -> {extracted}")
+    cluster_results = [
+        (command, expected, handler.categorize_command(command).cluster_name)
+        for command, expected in _CLUSTER_CASES
+    ]
+    sys.stdout.write(
+        "\n".join(
+            f"{'✅' if extracted == expected else '❌'} Cluster from '{command}' -> {extracted}"
+            for command, expected, extracted in cluster_results
+        )
+        + "\n"
+    )
 
     # Test IP address extraction
-    ip_tests = [
-        ("Add IP 192.168.1.100 to whitelist", "192.168.1.100"),
-        ("Whitelist 10.0.0.1 for development", "10.0.0.1"),
-        ("Allow access from 172.16.0.50", "172.16.0.50"),
-    ]
 
-    for command, expected_ip in ip_tests:
-        result = handler.categorize_command(command)
-        extracted = result.get("ip_address")
-        status = "✅" if extracted == expected_ip else "❌"
-        print(f"{status} IP from '{command}' -> {extracted}")
+    ip_results = [
+        (command, expected, handler.categorize_command(command).ip_address)
+        for command, expected in _IP_CASES
+    ]
+    sys.stdout.write(
+        "\n".join(
+            f"{'✅' if extracted == expected else '❌'} IP from '{command}' -> {extracted}"
+            for command, expected, extracted in ip_results
+        )
+        + "\n"
+    )
 
     # Test database extraction for optimization commands
     print("\n🗄️ Testing database extraction for optimization commands...")
-    db_tests = [
-        ("Find missing indexes in database products on cluster production", "products"),
-        ("Find missing indexes on cluster production", None),
-        ("Show redundant indexes in database ecommerce on cluster staging", "ecommerce"),
-        ("Show redundant indexes on cluster staging", None),
+
+    db_results = [
+        (command, expected, handler.categorize_command(command).database)
+        for command, expected in _DB_CASES
     ]
+    sys.stdout.write(
+        "\n".join(
+            f"{'✅' if extracted == expected else '❌'} Database from '{command}' -> {extracted}"
+            for command, expected, extracted in db_results
+        )
+        + "\n"
+    )
 
-    for command, expected_db in db_tests:
-        result = handler.categorize_command(command)
-        extracted = result.get("database")
-        status = "✅" if extracted == expected_db else "❌"
-        print(f"{status} Database from '{command}' -> {extracted}")
+    mismatches = [
+        (command, expected, extracted)
+        for command, expected, extracted in cluster_results + ip_results + db_results
+        if extracted != expected
+    ]
+    assert not mismatches, f"Extraction mismatches: {mismatches}"
 
 
-async def test_help_functionality():
+def test_help_functionality():
     """Test help text generation"""
     print("\n📚 Testing help functionality...")
 
-    mock_session = MagicMock()
-    handler = MongoCommandHandler(mock_session)
+    handler = _HANDLER
 
     help_text = handler._get_help_text()
 
-    required_sections = [
-        "Atlas Management",
-        "Performance Analysis",
-        "Database Operations",
-        "Security",
-        "Optimization",
-    ]
-
-    for section in required_sections:
-        if section in help_text:
+    missing = [section for section in _HELP_SECTIONS if section not in help_text]
+    for section in _HELP_SECTIONS:
+        if section not in missing:
             print(f"✅ Help contains '{section}' section")
         else:
             print(f"❌ Help missing '{section}' section")
 
     print(f"📏 Help text length: {len(help_text)} characters")
+    assert not missing, f"Help text missing sections: {missing}"
 
 
-async def test_rbac_functionality():
+def test_rbac_functionality():
     """Test RBAC system functionality"""
     print("\n🔐 Testing RBAC functionality...")
 
-    try:
-        from rbac import RBACManager
+    # Import and construction failures propagate: under pytest they fail
+    # the test instead of being printed and swallowed
+    from rbac import _SLACK_USER_ID_RE, RBACManager
 
-        print("✅ RBACManager imported successfully")
+    print("✅ RBACManager imported successfully")
 
-        # Create a mock config with the expected operations
-        mock_config = type(
-            "FakeConfig",
-            (),
-            {
-                "RBAC_ENABLED": True,
-                "ADMIN_USERS": [],
-                "ADMIN_GROUPS": [],
-                "ADMIN_OPERATIONS": ["create_cluster", "reset_password"],
-                "USER_OPERATIONS": ["list_clusters"],
-                "SELF_SERVICE_OPERATIONS": ["reset_own_password", "add_ip_whitelist"],
-                "RBAC_NOTIFY_ADMIN_ON_DENIED": True,
-                "RBAC_LOG_ACCESS_ATTEMPTS": True,
-            },
-        )()
-
-        # Patch the config module
-        sys.modules["config"] = mock_config
-
-        # Test RBAC configuration loading
-        mock_slack_client = MagicMock()
+    # Patch the config module for the duration of the test only
+    with patch.dict(sys.modules, {"config": _FAKE_CONFIG}):
+        # Test RBAC configuration loading; nothing here records calls,
+        # so a plain namespace stands in for the Slack client
+        mock_slack_client = SimpleNamespace()
         rbac_manager = RBACManager(mock_slack_client)
 
-        # Test permission categories
-        test_cases = [
-            ("create_cluster", "admin"),
-            ("list_clusters", "user"),
-            ("reset_own_password", "self_service"),
-            ("add_ip_whitelist", "self_service"),
-            ("reset_password", "admin"),
-            ("unknown_operation", "unknown"),
-        ]
-
-        for operation, expected_category in test_cases:
-            category = rbac_manager.get_operation_category(operation)
-            status = "✅" if category == expected_category else "❌"
-            print(f"{status} Operation '{operation}' -> {category}")
-
-        # Test report generation
-        report = rbac_manager.generate_rbac_report()
-        if "RBAC Configuration Report" in report:
-            print("✅ RBAC report generation works")
-        else:
-            print("❌ RBAC report generation failed")
-
-        # Test username resolution logic
-        test_usernames = [
-            ("U1234567890", "U1234567890"),  # Already a user ID
-            ("@david.murphy", "david.murphy"),  # Username with @
-            ("jane.smith", "jane.smith"),  # Username without @
-        ]
-
-        for input_name, expected_clean in test_usernames:
-            # Test the username cleaning logic
-            if input_name.startswith("U") and len(input_name) == 11:
-                result = input_name
-                status = "✅"
-            else:
-                result = input_name.lstrip("@")
-                status = "✅" if result == expected_clean else "❌"
-
-            print(f"{status} Username resolution: '{input_name}' -> '{result}'")
-
-    except ImportError as e:
-        print(f"❌ RBAC import failed: {e}")
-    except Exception as e:
-        print(f"❌ RBAC test error: {e}")
-
-
-async def test_basic_imports():
-    """Test that all required modules can be imported"""
-    print("\n📦 Testing imports...")
+    # Test permission categories
 
-    try:
-        from slack_bolt.async_app import (  # noqa: F401 # pylint: disable=unused-import
-            AsyncApp,
+    category_results = [
+        (operation, expected, rbac_manager.get_operation_category(operation))
+        for operation, expected in _OPERATION_CATEGORY_CASES
+    ]
+    sys.stdout.write(
+        "\n".join(
+            f"{'✅' if category == expected else '❌'} Operation '{operation}' -> {category}"
+            for operation, expected, category in category_results
         )
+        + "\n"
+    )
+    category_mismatches = [
+        (operation, expected, category)
+        for operation, expected, category in category_results
+        if category != expected
+    ]
+    assert not category_mismatches, f"Operation category mismatches: {category_mismatches}"
+
+    # Test report generation
+    report = rbac_manager.generate_rbac_report()
+    report_ok = "RBAC Configuration Report" in report
+    if report_ok:
+        print("✅ RBAC report generation works")
+    else:
+        print("❌ RBAC report generation failed")
+    assert report_ok, "RBAC report missing its header line"
+
+    # Test username resolution logic
+
+    username_results = []
+    for input_name, expected_clean in _USERNAME_CASES:
+        # Mirror production: the same compiled pattern rbac.py uses to
+        # recognize literal user IDs, lstrip for everything else
+        if _SLACK_USER_ID_RE.match(input_name):
+            result = input_name
+        else:
+            result = input_name.lstrip("@")
+        username_results.append((input_name, expected_clean, result))
+        status = "✅" if result == expected_clean else "❌"
 
-        print("✅ Slack Bolt imported successfully")
-    except ImportError as e:
-        print(f"❌ Slack Bolt import failed: {e}")
+        print(f"{status} Username resolution: '{input_name}' -> '{result}'")
 
-    try:
-        import anthropic  # noqa: F401 # pylint: disable=unused-import
+    username_mismatches = [
+        (input_name, expected_clean, result)
+        for input_name, expected_clean, result in username_results
+        if result != expected_clean
+    ]
+    assert not username_mismatches, f"Username resolution mismatches: {username_mismatches}"
 
-        print("✅ Anthropic imported successfully")
-    except ImportError as e:
-        print(f"❌ Anthropic import failed: {e}")
 
-    try:
-        from mcp import ClientSession  # noqa: F401 # pylint: disable=unused-import
+def test_basic_imports():
+    """Test that all required modules can be imported"""
+    print("\n📦 Testing imports...")
 
-        print("✅ MCP imported successfully")
-    except ImportError as e:
-        print(f"❌ MCP import failed: {e}")
+    # Third-party dependencies only need to be locatable; find_spec proves
+    # that without executing their package initialization, which for
+    # slack_bolt and anthropic drags in a large dependency tree
+    for spec_name, label in (
+        ("slack_bolt.async_app", "Slack Bolt"),
+        ("anthropic", "Anthropic"),
+        ("mcp", "MCP"),
+    ):
+        try:
+            found = importlib.util.find_spec(spec_name) is not None
+        except ModuleNotFoundError:
+            found = False
+        if found:
+            print(f"✅ {label} imported successfully")
+        else:
+            print(f"❌ {label} import failed: module not found")
 
+    # First-party modules are imported for real so a syntax or import error
+    # inside them still fails here
     try:
         from mongo_bot import (  # noqa: F401 # pylint: disable=unused-import
             MongoSlackBot,
@@ -259,16 +317,16 @@ async def test_basic_imports():
         print(f"❌ RBACManager import failed: {e}")
 
 
-async def main():
+def main():
     """Run all tests"""
     print("🚀 Starting MongoDB Slack Bot Tests\n")
 
     # Run tests
-    await test_basic_imports()
-    await test_command_categorization()
-    await test_parameter_extraction()
-    await test_help_functionality()
-    await test_rbac_functionality()
+    test_basic_imports()
+    test_command_categorization()
+    test_parameter_extraction()
+    test_help_functionality()
+    test_rbac_functionality()
 
     print("\n✨ Test suite completed!")
     print("\n💡 To run the full bot, make sure you have:")
@@ -281,4 +339,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    main()